@@ -363,55 +363,62 @@ Continue the conversation naturally, remembering the context from previous messa
         # In workflow pattern, this is determined by task dependencies
         previous_agent_name = None
 
-        # Execute tasks in parallel waves
+        # Execute tasks as soon as their dependencies complete, so a task never
+        # waits on unrelated slow tasks that happened to become ready with it
         max_workers = min(8, len(dag))  # Limit concurrent invocations
+        started: Set[str] = set()
 
-        while len(completed) < len(dag) and failed_task is None:
-            ready_tasks = get_ready_tasks(dag, completed)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_task: Dict[concurrent.futures.Future, str] = {}
 
-            if not ready_tasks:
-                if len(completed) < len(dag):
-                    remaining = set(dag.keys()) - completed
-                    raise ValueError(f"No tasks ready but workflow incomplete. Remaining: {remaining}")
-                break
+            while True:
+                # Submit newly ready tasks (none after a failure)
+                if failed_task is None:
+                    ready_tasks = [t for t in get_ready_tasks(dag, completed) if t not in started]
+                    if ready_tasks:
+                        print(f"Executing {len(ready_tasks)} tasks in parallel: {ready_tasks}", file=sys.stderr)
 
-            print(f"Executing {len(ready_tasks)} tasks in parallel: {ready_tasks}", file=sys.stderr)
+                    for task_id in ready_tasks:
+                        agent_name = get_agent_display_name(task_id)
 
-            # Execute ready tasks in parallel
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all ready tasks
-                future_to_task = {}
-                for task_id in ready_tasks:
-                    agent_name = get_agent_display_name(task_id)
+                        # Build prompt with dependency results
+                        dep_results = {dep: results[dep] for dep in dag[task_id] if dep in results}
+                        task_prompt = build_task_prompt(task_id, base_prompt, dep_results)
+
+                        # Determine from_agent based on dependencies
+                        from_agent = get_from_agent_for_task(task_id, dag)
+
+                        # Emit node_start event with from_agent and handoff_prompt for dual-pane UI
+                        emit_event({
+                            "event_type": "node_start",
+                            "timestamp": get_timestamp(),
+                            "session_id": session_id,
+                            "workflow_id": args.workflow_id,
+                            "trace_id": args.trace_id,
+                            "turn_number": turn_number,
+                            "node_id": task_id,
+                            "node_name": agent_name,
+                            "from_agent": from_agent,
+                            "handoff_prompt": task_prompt
+                        })
 
-                    # Build prompt with dependency results
-                    dep_results = {dep: results[dep] for dep in dag[task_id] if dep in results}
-                    task_prompt = build_task_prompt(task_id, base_prompt, dep_results)
-
-                    # Determine from_agent based on dependencies
-                    from_agent = get_from_agent_for_task(task_id, dag)
-
-                    # Emit node_start event with from_agent and handoff_prompt for dual-pane UI
-                    emit_event({
-                        "event_type": "node_start",
-                        "timestamp": get_timestamp(),
-                        "session_id": session_id,
-                        "workflow_id": args.workflow_id,
-                        "trace_id": args.trace_id,
-                        "turn_number": turn_number,
-                        "node_id": task_id,
-                        "node_name": agent_name,
-                        "from_agent": from_agent,
-                        "handoff_prompt": task_prompt
-                    })
-
-                    # Submit task
-                    future = executor.submit(invoke_agent_remotely, task_id, task_prompt, session_id)
-                    future_to_task[future] = task_id
-
-                # Collect results
-                for future in concurrent.futures.as_completed(future_to_task):
-                    task_id = future_to_task[future]
+                        # Submit task
+                        future = executor.submit(invoke_agent_remotely, task_id, task_prompt, session_id)
+                        future_to_task[future] = task_id
+                        started.add(task_id)
+
+                if not future_to_task:
+                    if failed_task is None and len(completed) < len(dag):
+                        remaining = set(dag.keys()) - completed
+                        raise ValueError(f"No tasks ready but workflow incomplete. Remaining: {remaining}")
+                    break
+
+                # Collect whichever tasks finish first
+                done, _ = concurrent.futures.wait(
+                    future_to_task, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    task_id = future_to_task.pop(future)
                     agent_name = get_agent_display_name(task_id)
 
                     try:
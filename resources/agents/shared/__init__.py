@@ -23,8 +23,12 @@ chronological tool execution timelines across multi-agent workflows.
 
 ### Event Persistence
 - `write_tool_event()`: Fire-and-forget event writing to DynamoDB
+- `write_tool_events_batch()`: Write related events in one BatchWriteItem request
+- `enqueue_tool_event()`: Hand an event to the background writer thread
+- `flush_tool_events()`: Synchronously write any queued events
 - `query_tool_events()`: Retrieve events for a workflow session
 - `get_tool_events_table_name()`: Resolve DynamoDB table name from configuration
+- `get_dynamodb_client_metrics()`: Self-measured put_item and batch write latency (DEBUG only)
 
 ### Gateway Integration
 - `GatewayTokenManager`: OAuth token management for MCP Gateway authentication
@@ -174,8 +178,12 @@ from .instrumentation import (
 
 from .dynamodb_client import (
     write_tool_event,
+    write_tool_events_batch,
+    enqueue_tool_event,
+    flush_tool_events,
     query_tool_events,
-    get_tool_events_table_name
+    get_tool_events_table_name,
+    get_dynamodb_client_metrics
 )
 
 from .gateway_client import GatewayTokenManager, invoke_with_gateway
@@ -203,8 +211,12 @@ __all__ = [
     'clear_instrumentation_context',
     # DynamoDB
     'write_tool_event',
+    'write_tool_events_batch',
+    'enqueue_tool_event',
+    'flush_tool_events',
     'query_tool_events',
     'get_tool_events_table_name',
+    'get_dynamodb_client_metrics',
     # Gateway
     'GatewayTokenManager',
     'invoke_with_gateway',
@@ -32,10 +32,11 @@ maintaining performance through caching.
 
 Events are validated against a strict schema before writing:
 
-- **Required fields**: workflow_id, timestamp, event_id, agent, tool_name, status
-- **Status values**: Must be 'started', 'completed', or 'error'
-- **Conditional fields**: duration_ms required for completed/error, error_message for error
-- **Data types**: String fields must be non-empty, duration_ms must be non-negative integer
+- **Required fields**: workflow_id, timestamp, event_id, agent_name, system, operation,
+  status, event_type (matches the TypeScript ToolCallEvent interface)
+- **Status values**: Must be 'started', 'completed', or 'failed'
+- **Conditional fields**: duration_ms for completed/failed, error_message for failed
+- **Timestamps**: Integer epoch milliseconds, so no date formatting is needed on write
 
 Invalid events are rejected with detailed logging but never raise exceptions.
 
@@ -54,7 +55,13 @@ calling code, ensuring monitoring transparency.
 ## Performance Optimizations
 
 - **Table name caching**: Avoids repeated SSM/environment lookups
+- **Self-measurement**: put_item and batch flush latency counters via
+  get_dynamodb_client_metrics(), collected only when DEBUG logging is enabled so
+  production writes pay nothing
 - **Schema validation**: Performed before DynamoDB operations to avoid unnecessary calls
+- **Batch writes**: write_tool_events_batch() sends related events in one BatchWriteItem
+- **Background writes**: enqueue_tool_event() hands events to a daemon writer thread
+  so callers never wait on DynamoDB; flush_tool_events() drains it at exit
 - **Efficient queries**: Uses DynamoDB Query operation with partition key
 - **TTL management**: Automatic cleanup prevents unbounded table growth
 
@@ -78,16 +85,48 @@ The module gracefully degrades when any of these services are unavailable,
 ensuring tool execution continues normally.
 """
 
+import atexit
 import boto3
 import os
+import queue
+import threading
 import time
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, TypedDict
 from botocore.exceptions import ClientError
 
 # Configuration constants
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 TTL_DURATION_SECONDS = 7200  # 2 hours
+METRICS_LOG_INTERVAL = 1000  # Log write stats every N put_items / batch flushes (DEBUG only)
+REQUIRED_EVENT_FIELDS = ('workflow_id', 'timestamp', 'event_id', 'agent_name', 'system', 'operation', 'status', 'event_type')
+VALID_STATUSES = ('started', 'completed', 'failed')
+EVENT_QUEUE_MAXSIZE = 1024  # Background write queue bound; overflow is written inline
+EVENT_BATCH_SIZE = 25  # BatchWriteItem maximum
+EVENT_BATCH_LINGER_SECONDS = 0.05  # Background writer waits this long to fill a batch
+
+
+class ToolCallEvent(TypedDict, total=False):
+    """
+    Tool call event as written to DynamoDB (mirrors the TypeScript ToolCallEvent).
+
+    A TypedDict rather than a class so events stay plain dicts: boto3 marshals
+    them directly and the background writer can batch them without conversion.
+    """
+
+    workflow_id: str
+    timestamp: int
+    event_type: str
+    event_id: str
+    agent_name: str
+    system: str
+    operation: str
+    status: str
+    input: str
+    duration_ms: int
+    error_message: str
+    started_implicit: bool
+    ttl: int
 
 
 def _get_tool_events_table_param() -> str:
@@ -107,6 +146,19 @@ def _get_tool_events_table_param() -> str:
 # Module-level cache for table name
 _table_name: str | None = None
 
+# Guards the cold-path resolution so concurrent threads only hit SSM once
+_table_name_lock = threading.Lock()
+
+# Background writer state (queue and worker thread are created on first enqueue)
+_event_queue: queue.Queue | None = None
+_event_worker_lock = threading.Lock()
+
+# put_item and batch flush self-metrics (only updated when DEBUG logging is enabled)
+_metrics: Dict[str, int] = {
+    'put_count': 0, 'put_total_ns': 0, 'put_fail': 0,
+    'batch_count': 0, 'batch_items': 0, 'batch_total_ns': 0, 'batch_fail': 0,
+}
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -145,45 +197,52 @@ def get_tool_events_table_name() -> str | None:
 
     Note:
         - Table name is cached after first successful resolution
+        - Resolution is guarded by a lock (double-checked) so concurrent
+          threads on a cold start only pay for one SSM lookup
         - SSM Parameter Store is preferred for production deployments
         - Environment variable is useful for local development
     """
     global _table_name
 
-    # Return cached table name if available
+    # Return cached table name if available (lock-free fast path)
     if _table_name is not None:
         return _table_name
 
-    # Try environment variable first (faster than SSM)
-    env_table = os.environ.get('AGENTIFY_TABLE_NAME')
-    if env_table:
-        _table_name = env_table
-        logger.debug(f'Using table name from environment: {_table_name}')
-        return _table_name
+    with _table_name_lock:
+        # Re-check: another thread may have resolved it while we waited
+        if _table_name is not None:
+            return _table_name
 
-    # Try SSM Parameter Store (preferred for production)
-    try:
-        ssm = boto3.client('ssm', region_name=AWS_REGION)
+        # Try environment variable first (faster than SSM)
+        env_table = os.environ.get('AGENTIFY_TABLE_NAME')
+        if env_table:
+            _table_name = env_table
+            logger.debug('Using table name from environment: %s', _table_name)
+            return _table_name
+
+        # Try SSM Parameter Store (preferred for production)
         param_path = _get_tool_events_table_param()
-        response = ssm.get_parameter(Name=param_path)
-        _table_name = response['Parameter']['Value']
-        logger.debug(f'Retrieved table name from SSM: {_table_name}')
-        return _table_name
-    except ClientError as e:
-        error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-        if error_code == 'ParameterNotFound':
-            logger.debug(f'SSM parameter {_get_tool_events_table_param()} not found')
-        else:
-            logger.warning(f'SSM error ({error_code}): {e}')
-    except Exception as e:
-        logger.warning(f'Unexpected error getting table name from SSM: {e}')
+        try:
+            ssm = boto3.client('ssm', region_name=AWS_REGION)
+            response = ssm.get_parameter(Name=param_path)
+            _table_name = response['Parameter']['Value']
+            logger.debug('Retrieved table name from SSM: %s', _table_name)
+            return _table_name
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            if error_code == 'ParameterNotFound':
+                logger.debug('SSM parameter %s not found', param_path)
+            else:
+                logger.warning('SSM error (%s): %s', error_code, e)
+        except Exception as e:
+            logger.warning('Unexpected error getting table name from SSM: %s', e)
 
     # Graceful degradation - no table configured
     logger.debug('No DynamoDB table configured - monitoring disabled')
     return None
 
 
-def write_tool_event(event: Dict[str, Any]) -> bool:
+def write_tool_event(event: ToolCallEvent) -> bool:
     """
     Write a tool call event to DynamoDB.
 
@@ -194,14 +253,16 @@ def write_tool_event(event: Dict[str, Any]) -> bool:
     Args:
         event: Event data dictionary containing:
             - workflow_id (str): Workflow execution UUID (partition key)
-            - timestamp (str): ISO 8601 timestamp with microseconds (sort key)
-            - event_id (str): UUID for event deduplication
-            - agent (str): Agent name that executed the tool
-            - tool_name (str): Name of the tool function
-            - status (str): 'started', 'completed', or 'error'
-            - parameters (str, optional): JSON string of tool parameters
-            - duration_ms (int, optional): Execution time for completed/error
-            - error_message (str, optional): Error description for error events
+            - timestamp (int): Epoch milliseconds (sort key)
+            - event_type (str): Always 'tool_call'
+            - event_id (str): Identifier shared by a call's started/terminal events
+            - agent_name (str): Agent name that executed the tool
+            - system (str): 'agent' for local tools, 'gateway' for Gateway tools
+            - operation (str): Name of the tool
+            - status (str): 'started', 'completed', or 'failed'
+            - input (str, optional): Truncated JSON string of tool parameters
+            - duration_ms (int, optional): Execution time for completed/failed
+            - error_message (str, optional): Error description for failed events
             - ttl (int, optional): Unix timestamp for auto-deletion
 
     Returns:
@@ -215,12 +276,14 @@ def write_tool_event(event: Dict[str, Any]) -> bool:
         >>> # Write a 'started' event
         >>> success = write_tool_event({
         ...     'workflow_id': 'abc-123',
-        ...     'timestamp': '2024-01-15T10:30:00.123456+00:00',
+        ...     'timestamp': 1705314600123,
+        ...     'event_type': 'tool_call',
         ...     'event_id': 'evt-456',
-        ...     'agent': 'analyzer',
-        ...     'tool_name': 'lookup_user',
+        ...     'agent_name': 'analyzer',
+        ...     'system': 'agent',
+        ...     'operation': 'lookup_user',
         ...     'status': 'started',
-        ...     'parameters': '{"user_id": "user-789"}'
+        ...     'input': '{"user_id": "user-789"}'
         ... })
         >>> # success is True on successful write, False on failure
 
@@ -235,19 +298,14 @@ def write_tool_event(event: Dict[str, Any]) -> bool:
         logger.debug('Cannot write tool event: table not configured')
         return False
 
-    # Validate required fields (supports new TypeScript ToolCallEvent format)
-    required_fields = ['workflow_id', 'timestamp', 'event_id', 'agent_name', 'system', 'operation', 'status', 'event_type']
-    for field in required_fields:
-        if field not in event:
-            logger.warning(f'Cannot write tool event: missing required field "{field}"')
-            return False
-
-    # Validate status value (TypeScript uses 'failed' not 'error')
-    valid_statuses = ['started', 'completed', 'failed']
-    if event.get('status') not in valid_statuses:
-        logger.warning(f'Invalid status value: {event.get("status")}')
+    if not _validate_event(event):
         return False
 
+    # Only measure ourselves when someone is looking (DEBUG enabled)
+    track_metrics = logger.isEnabledFor(logging.DEBUG)
+    start_ns = time.perf_counter_ns() if track_metrics else 0
+    written = False
+
     try:
         # Add TTL if not present
         if 'ttl' not in event:
@@ -261,28 +319,266 @@ def write_tool_event(event: Dict[str, Any]) -> bool:
         table.put_item(Item=event)
 
         logger.debug(
-            f"Wrote tool event: {event.get('system', 'unknown')}:{event.get('operation', 'unknown')} "
-            f"[{event.get('status', 'unknown')}]"
+            'Wrote tool event: %s:%s [%s]',
+            event.get('system', 'unknown'),
+            event.get('operation', 'unknown'),
+            event.get('status', 'unknown'),
         )
+        written = True
         return True
 
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
         if error_code == 'ResourceNotFoundException':
-            logger.warning(f'DynamoDB table {table_name} does not exist')
+            logger.warning('DynamoDB table %s does not exist', table_name)
         elif error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-            logger.warning(f'Access denied to DynamoDB table {table_name}')
+            logger.warning('Access denied to DynamoDB table %s', table_name)
         elif error_code == 'ProvisionedThroughputExceededException':
-            logger.warning(f'DynamoDB table {table_name} throughput exceeded')
+            logger.warning('DynamoDB table %s throughput exceeded', table_name)
         else:
-            logger.warning(f'DynamoDB ClientError ({error_code}): {e}')
+            logger.warning('DynamoDB ClientError (%s): %s', error_code, e)
         return False
 
     except Exception as e:
         # Graceful degradation: log error and return False
-        logger.warning(f'Failed to write tool event: {e}')
+        logger.warning('Failed to write tool event: %s', e)
+        return False
+
+    finally:
+        if track_metrics:
+            _record_put_metrics(start_ns, written)
+
+
+def write_tool_events_batch(events: List[ToolCallEvent]) -> bool:
+    """
+    Write several tool call events to DynamoDB in one BatchWriteItem request.
+
+    Used to flush a tool's 'started' and terminal events together so each
+    tool call costs one round-trip instead of two. Same fire-and-forget
+    contract as write_tool_event: failures are logged, never raised.
+
+    Args:
+        events: Event dictionaries in the write_tool_event format
+
+    Returns:
+        bool: True if every event was written, False otherwise
+
+    Usage:
+        >>> from agents.shared.dynamodb_client import write_tool_events_batch
+        >>>
+        >>> write_tool_events_batch([started_event, completed_event])
+
+    Important:
+        - Invalid events are skipped and make the call return False
+        - Events sharing workflow_id and timestamp collapse to the last one,
+          matching what two sequential put_item calls would leave behind
+    """
+    table_name = get_tool_events_table_name()
+    if not table_name:
+        logger.debug('Cannot write tool events: table not configured')
         return False
 
+    valid = [event for event in events if _validate_event(event)]
+    if not valid:
+        return False
+
+    # Only measure ourselves when someone is looking (DEBUG enabled)
+    track_metrics = logger.isEnabledFor(logging.DEBUG)
+    start_ns = time.perf_counter_ns() if track_metrics else 0
+    written = False
+
+    try:
+        ttl = int(time.time()) + TTL_DURATION_SECONDS
+        dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+        table = dynamodb.Table(table_name)
+
+        # batch_writer chunks into 25-item requests and retries unprocessed items
+        with table.batch_writer(overwrite_by_pkeys=['workflow_id', 'timestamp']) as batch:
+            for event in valid:
+                event.setdefault('ttl', ttl)
+                batch.put_item(Item=event)
+
+        logger.debug('Wrote %d tool events in batch', len(valid))
+        written = True
+        return len(valid) == len(events)
+
+    except ClientError as e:
+        error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+        logger.warning('DynamoDB ClientError during batch write (%s): %s', error_code, e)
+        return False
+
+    except Exception as e:
+        logger.warning('Failed to write tool events batch: %s', e)
+        return False
+
+    finally:
+        if track_metrics:
+            _record_batch_metrics(start_ns, len(valid), written)
+
+
+def enqueue_tool_event(event: ToolCallEvent) -> None:
+    """
+    Queue a tool call event for writing by the background writer thread.
+
+    Keeps DynamoDB latency off the caller's critical path: the event is handed
+    to a daemon thread that drains the queue in BatchWriteItem-sized chunks.
+    If the queue is full the event is written inline instead of being dropped.
+    Remaining events are flushed at interpreter exit.
+
+    Args:
+        event: Event data dictionary in the write_tool_event format
+
+    Usage:
+        >>> from agents.shared.dynamodb_client import enqueue_tool_event
+        >>>
+        >>> enqueue_tool_event(started_event)  # Returns immediately
+    """
+    try:
+        _get_event_queue().put_nowait(event)
+    except queue.Full:
+        logger.debug('Tool event queue full, writing inline')
+        write_tool_event(event)
+
+
+def flush_tool_events() -> None:
+    """
+    Write any queued tool events synchronously.
+
+    Called automatically at exit; call it explicitly before a runtime freezes
+    or terminates the process (e.g. at the end of a Lambda handler).
+    """
+    if _event_queue is None:
+        return
+
+    while True:
+        batch = _drain_event_queue(_event_queue, block=False)
+        if not batch:
+            return
+        write_tool_events_batch(batch)
+
+
+def _get_event_queue() -> queue.Queue:
+    """Get the background write queue, starting the writer thread on first use."""
+    global _event_queue
+    if _event_queue is not None:
+        return _event_queue
+
+    with _event_worker_lock:
+        if _event_queue is None:
+            event_queue = queue.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+            threading.Thread(
+                target=_event_worker, args=(event_queue,), name='tool-event-writer', daemon=True,
+            ).start()
+            atexit.register(flush_tool_events)
+            _event_queue = event_queue
+    return _event_queue
+
+
+def _drain_event_queue(event_queue: queue.Queue, block: bool) -> List[ToolCallEvent]:
+    """
+    Take up to EVENT_BATCH_SIZE events from the queue.
+
+    When blocking, waits for the first event and then up to
+    EVENT_BATCH_LINGER_SECONDS for more, so bursts of tool calls share one
+    BatchWriteItem. Otherwise takes only what is already queued.
+    """
+    batch = []
+    try:
+        if block:
+            batch.append(event_queue.get())
+            deadline = time.monotonic() + EVENT_BATCH_LINGER_SECONDS
+            while len(batch) < EVENT_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                batch.append(event_queue.get(timeout=remaining))
+        while len(batch) < EVENT_BATCH_SIZE:
+            batch.append(event_queue.get_nowait())
+    except queue.Empty:
+        pass
+    return batch
+
+
+def _event_worker(event_queue: queue.Queue) -> None:
+    """Background writer loop: block for an event, then write it with any others queued."""
+    while True:
+        batch = _drain_event_queue(event_queue, block=True)
+        try:
+            write_tool_events_batch(batch)
+        except Exception as e:
+            # write_tool_events_batch never raises, but the thread must not die
+            logger.warning('Background tool event write failed: %s', e)
+
+
+def _validate_event(event: ToolCallEvent) -> bool:
+    """Check an event has the required fields and a known status, logging why not."""
+    # Validate required fields (supports new TypeScript ToolCallEvent format)
+    for field in REQUIRED_EVENT_FIELDS:
+        if field not in event:
+            logger.warning('Cannot write tool event: missing required field "%s"', field)
+            return False
+
+    # Validate status value (TypeScript uses 'failed' not 'error')
+    if event.get('status') not in VALID_STATUSES:
+        logger.warning('Invalid status value: %s', event.get('status'))
+        return False
+
+    return True
+
+
+def _record_put_metrics(start_ns: int, succeeded: bool) -> None:
+    """Accumulate put_item latency and periodically log a summary."""
+    _metrics['put_count'] += 1
+    _metrics['put_total_ns'] += time.perf_counter_ns() - start_ns
+    if not succeeded:
+        _metrics['put_fail'] += 1
+
+    count = _metrics['put_count']
+    if count % METRICS_LOG_INTERVAL == 0:
+        logger.info(
+            'DynamoDB put_item stats: %d writes, %d failed, avg %.2fms',
+            count, _metrics['put_fail'], _metrics['put_total_ns'] / count / 1_000_000,
+        )
+
+
+def _record_batch_metrics(start_ns: int, items: int, succeeded: bool) -> None:
+    """Accumulate batch flush latency and periodically log a summary."""
+    _metrics['batch_count'] += 1
+    _metrics['batch_items'] += items
+    _metrics['batch_total_ns'] += time.perf_counter_ns() - start_ns
+    if not succeeded:
+        _metrics['batch_fail'] += 1
+
+    count = _metrics['batch_count']
+    if count % METRICS_LOG_INTERVAL == 0:
+        logger.info(
+            'DynamoDB batch write stats: %d flushes (%d events), %d failed, avg %.2fms',
+            count, _metrics['batch_items'], _metrics['batch_fail'],
+            _metrics['batch_total_ns'] / count / 1_000_000,
+        )
+
+
+def get_dynamodb_client_metrics() -> Dict[str, Any]:
+    """
+    Get self-measured DynamoDB write statistics for the instrumentation layer.
+
+    Covers both inline put_item writes (write_tool_event) and batch flushes
+    (write_tool_events_batch, used by the background writer). Counters are only
+    updated while DEBUG logging is enabled, so in production they stay at zero
+    and writes pay no measurement overhead.
+
+    Returns:
+        Dict[str, Any]: put_count, put_fail, put_total_ns, avg_put_ms,
+            batch_count, batch_items, batch_fail, batch_total_ns and avg_batch_ms
+    """
+    put_count = _metrics['put_count']
+    batch_count = _metrics['batch_count']
+    return {
+        **_metrics,
+        'avg_put_ms': _metrics['put_total_ns'] / put_count / 1_000_000 if put_count else 0.0,
+        'avg_batch_ms': _metrics['batch_total_ns'] / batch_count / 1_000_000 if batch_count else 0.0,
+    }
+
 
 def query_tool_events(workflow_id: str, limit: int = 100) -> List[Dict[str, Any]]:
     """
@@ -312,13 +608,14 @@ def query_tool_events(workflow_id: str, limit: int = 100) -> List[Dict[str, Any]
         - Returns empty list on any error
         - Designed for Demo Viewer polling at 500ms intervals
     """
-    # Validate input parameters
-    if not workflow_id or not isinstance(workflow_id, str) or not workflow_id.strip():
+    # Validate input parameters (strip once, reuse for the query key)
+    wid = workflow_id.strip() if isinstance(workflow_id, str) else ''
+    if not wid:
         logger.warning('Invalid workflow_id provided to query_tool_events')
         return []
 
     if not isinstance(limit, int) or limit <= 0:
-        logger.warning(f'Invalid limit provided to query_tool_events: {limit}, using default 100')
+        logger.warning('Invalid limit provided to query_tool_events: %s, using default 100', limit)
         limit = 100
 
     # Get table name with graceful degradation
@@ -335,28 +632,28 @@ def query_tool_events(workflow_id: str, limit: int = 100) -> List[Dict[str, Any]
         # Query DynamoDB
         response = table.query(
             KeyConditionExpression='workflow_id = :wid',
-            ExpressionAttributeValues={':wid': workflow_id.strip()},
+            ExpressionAttributeValues={':wid': wid},
             Limit=limit,
             ScanIndexForward=True  # Sort by timestamp ascending (oldest first)
         )
 
         events = response.get('Items', [])
-        logger.debug(f'Retrieved {len(events)} events for workflow {workflow_id}')
+        logger.debug('Retrieved %d events for workflow %s', len(events), wid)
         return events
 
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
         if error_code == 'ResourceNotFoundException':
-            logger.warning(f'DynamoDB table {table_name} does not exist for query')
+            logger.warning('DynamoDB table %s does not exist for query', table_name)
         elif error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-            logger.warning(f'Access denied to DynamoDB table {table_name} for query')
+            logger.warning('Access denied to DynamoDB table %s for query', table_name)
         elif error_code == 'ProvisionedThroughputExceededException':
-            logger.warning(f'DynamoDB table {table_name} read throughput exceeded')
+            logger.warning('DynamoDB table %s read throughput exceeded', table_name)
         else:
-            logger.warning(f'DynamoDB ClientError during query ({error_code}): {e}')
+            logger.warning('DynamoDB ClientError during query (%s): %s', error_code, e)
         return []
 
     except Exception as e:
         # Graceful degradation: log error and return empty list
-        logger.warning(f'Failed to query tool events for workflow {workflow_id}: {e}')
+        logger.warning('Failed to query tool events for workflow %s: %s', wid, e)
         return []
@@ -45,29 +45,59 @@ a reference to the MCP client session. If the session closes before the
 agent executes tools, you get "client session is not running" errors.
 
 This module keeps the MCP session open during the entire agent execution,
-ensuring Gateway tools work correctly.
+ensuring Gateway tools work correctly. The open session and its tool list
+are cached for `GATEWAY_SESSION_CACHE_TTL` seconds (default 300) so warm
+invocations skip the MCP handshake and tool discovery.
 """
 
+import atexit
+import json
 import logging
 import os
-import uuid
-from datetime import datetime, timedelta, timezone
+import random
+import tempfile
+import threading
+import time
 from functools import lru_cache
+from operator import attrgetter
 from typing import TypedDict
+from urllib.parse import urlencode
 
-import boto3
 import httpx
-from botocore.exceptions import ClientError
-from mcp.client.streamable_http import streamablehttp_client
 from strands import Agent
 from strands.models.bedrock import BedrockModel
-from strands.tools.mcp import MCPClient
 
-from agents.shared.instrumentation import get_instrumentation_context
-from agents.shared.dynamodb_client import write_tool_event
+from agents.shared.instrumentation import get_instrumentation_context, new_event_id
+from agents.shared.dynamodb_client import enqueue_tool_event
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json accepts bytes too
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Opt-in on-disk token cache (e.g. /tmp/agentify_gateway_token.json) so a
+# restarted process in the same sandbox can reuse a still-valid token
+TOKEN_CACHE_FILE = os.environ.get('GATEWAY_TOKEN_CACHE_FILE')
+
+# Opt-in background refresh so no request ever waits on the Cognito POST
+TOKEN_PREFETCH_ENABLED = os.environ.get('GATEWAY_TOKEN_PREFETCH') == '1'
+TOKEN_PREFETCH_LEAD_SECONDS = 60
+
+# Open MCP sessions (and their tool proxies) are reused across invocations
+# for this long before being rebuilt
+MCP_SESSION_CACHE_TTL_SECONDS = float(os.environ.get('GATEWAY_SESSION_CACHE_TTL', '300'))
+
+# Model used when invoke_with_gateway is called without model_id, read once
+# per process (AgentCore sets it at container start)
+_DEFAULT_MODEL_ID = os.environ.get('AGENT_MODEL_ID')
+
+# Tool input and error messages are stored in DynamoDB events truncated
+# to this many characters (including the trailing '...')
+TOOL_INPUT_MAX_CHARS = 200
+TOOL_ERROR_MAX_CHARS = 500
+
 
 class GatewayConfig(TypedDict, total=False):
     """Gateway configuration from SSM Parameter Store."""
@@ -79,18 +109,84 @@ class GatewayConfig(TypedDict, total=False):
     scope: str
 
 
-@lru_cache(maxsize=1)
+# Gateway config is re-read from SSM after this many seconds so rotated
+# credentials are picked up without restarting the container
+SSM_CACHE_TTL_SECONDS = float(os.environ.get('AGENTIFY_SSM_CACHE_TTL', '600'))
+
+# Failed SSM reads (throttling, IAM propagation) are retried after this
+# many seconds instead of disabling Gateway for the full cache TTL
+SSM_ERROR_CACHE_TTL_SECONDS = 30.0
+
+# Parameter names stored under /agentify/{project}/gateway/ by setup.sh
+GATEWAY_CONFIG_KEYS = ('url', 'client_id', 'client_secret', 'token_endpoint', 'scope')
+
+_ssm_client = None
+_ssm_cache: dict = {'project': None, 'value': None, 'expires': 0.0}
+_ssm_cache_lock = threading.Lock()
+
+
+def _get_ssm_client():
+    """Get the shared SSM client, creating it on first use."""
+    global _ssm_client
+    if _ssm_client is None:
+        import boto3  # Lazy import: only needed when Gateway config is read
+        _ssm_client = boto3.client('ssm')
+    return _ssm_client
+
+
 def _get_gateway_config_from_ssm() -> GatewayConfig | None:
+    """
+    Get Gateway configuration, served from a TTL cache.
+
+    The cache is keyed by AGENTIFY_PROJECT_NAME and holds the last result
+    (including None for a missing config) for AGENTIFY_SSM_CACHE_TTL seconds
+    (default 600). SSM errors are cached as None for only
+    SSM_ERROR_CACHE_TTL_SECONDS so a transient failure does not disable
+    Gateway until the next full refresh. Only one thread performs the SSM
+    read when the cache expires.
+
+    Returns:
+        GatewayConfig dict if credentials found, None otherwise.
+    """
+    project = os.environ.get('AGENTIFY_PROJECT_NAME')
+    if project == _ssm_cache['project'] and time.monotonic() < _ssm_cache['expires']:
+        return _ssm_cache['value']
+
+    with _ssm_cache_lock:
+        if project == _ssm_cache['project'] and time.monotonic() < _ssm_cache['expires']:
+            return _ssm_cache['value']
+
+        from botocore.exceptions import ClientError
+
+        ttl = SSM_CACHE_TTL_SECONDS
+        try:
+            config = _load_gateway_config_from_ssm(project)
+        except ClientError as e:
+            logger.warning('Failed to read Gateway config from SSM: %s', e)
+            config = None
+            ttl = SSM_ERROR_CACHE_TTL_SECONDS
+
+        _ssm_cache['project'] = project
+        _ssm_cache['value'] = config
+        _ssm_cache['expires'] = time.monotonic() + ttl
+        return config
+
+
+def _load_gateway_config_from_ssm(project: str | None) -> GatewayConfig | None:
     """
     Read Gateway configuration from SSM Parameter Store.
 
     Credentials are stored at `/agentify/{project}/gateway/*` by setup.sh.
-    The project name is read from AGENTIFY_PROJECT_NAME environment variable.
+
+    Args:
+        project: Project name from AGENTIFY_PROJECT_NAME environment variable
 
     Returns:
         GatewayConfig dict if credentials found, None otherwise.
+
+    Raises:
+        ClientError: If the SSM request fails
     """
-    project = os.environ.get('AGENTIFY_PROJECT_NAME')
     if not project:
         logger.debug('AGENTIFY_PROJECT_NAME not set, cannot read Gateway config from SSM')
         return None
@@ -98,40 +194,56 @@ def _get_gateway_config_from_ssm() -> GatewayConfig | None:
     prefix = f'/agentify/{project}/gateway'
     logger.debug('Reading Gateway config from SSM: %s/*', prefix)
 
-    try:
-        ssm = boto3.client('ssm')
+    ssm = _get_ssm_client()
 
-        # Get all parameters under the prefix
-        response = ssm.get_parameters_by_path(
-            Path=prefix,
-            WithDecryption=True,  # Required for SecureString (client_secret)
-        )
+    # Names are known up front, so fetch them in one unpaginated call
+    response = ssm.get_parameters(
+        Names=[f'{prefix}/{key}' for key in GATEWAY_CONFIG_KEYS],
+        WithDecryption=True,  # Required for SecureString (client_secret)
+    )
 
-        if not response.get('Parameters'):
-            logger.debug('No Gateway parameters found in SSM at %s', prefix)
-            return None
-
-        # Parse parameters into config dict
-        config: GatewayConfig = {}
-        for param in response['Parameters']:
-            # Extract key name from full path: /agentify/project/gateway/url -> url
-            key = param['Name'].split('/')[-1]
-            config[key] = param['Value']
-
-        # Validate required fields
-        required = ['url', 'client_id', 'client_secret', 'token_endpoint', 'scope']
-        missing = [k for k in required if not config.get(k)]
-        if missing:
-            logger.warning('Gateway config incomplete, missing: %s', missing)
-            return None
-
-        logger.info('Gateway config loaded from SSM: %s', prefix)
-        return config
+    if not response.get('Parameters'):
+        logger.debug('No Gateway parameters found in SSM at %s', prefix)
+        return None
 
-    except ClientError as e:
-        logger.warning('Failed to read Gateway config from SSM: %s', e)
+    # get_parameters reports names it could not find instead of failing
+    invalid = response.get('InvalidParameters')
+    if invalid:
+        logger.warning('Gateway SSM parameters not found: %s', invalid)
+
+    # Parse parameters into config dict
+    config: GatewayConfig = {}
+    for param in response['Parameters']:
+        # Extract key name from full path: /agentify/project/gateway/url -> url
+        key = param['Name'].rsplit('/', 1)[-1]
+        config[key] = param['Value']
+
+    # Validate required fields
+    missing = [k for k in GATEWAY_CONFIG_KEYS if not config.get(k)]
+    if missing:
+        logger.warning('Gateway config incomplete, missing: %s', missing)
         return None
 
+    logger.info('Gateway config loaded from SSM: %s', prefix)
+    return config
+
+
+@lru_cache(maxsize=1)
+def _get_http_client() -> httpx.Client:
+    """
+    Get the shared HTTP client for Cognito token requests.
+
+    One client is reused by every token manager so refreshes keep the
+    TCP/TLS connection alive instead of re-handshaking each time. It is
+    created on first refresh, so processes without a Gateway never build it.
+    """
+    client = httpx.Client(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=4, max_connections=4),
+    )
+    atexit.register(client.close)
+    return client
+
 
 class GatewayTokenManager:
     """
@@ -140,21 +252,30 @@ class GatewayTokenManager:
     This class handles the OAuth2 client credentials flow with Cognito,
     caching tokens and automatically refreshing them before expiry.
 
-    The token manager uses a 5-minute buffer before token expiry to ensure
-    tokens are refreshed proactively, avoiding authentication failures
-    during tool invocations.
-
-    Credentials are read from SSM Parameter Store automatically.
+    Tokens are refreshed after ~75% of their lifetime (with +/-30s jitter)
+    rather than a fixed buffer before expiry. This keeps a safe margin for
+    short-lived tokens and de-correlates refreshes across concurrent workers
+    so they don't hit Cognito at the same moment. GATEWAY_OAUTH_EXPIRY_BUFFER
+    (default 300s) sets the minimum margin kept before the real expiry.
+
+    Credentials are read from SSM Parameter Store automatically. When
+    GATEWAY_TOKEN_CACHE_FILE is set, tokens are also persisted to that file
+    so a restarted process can reuse a token that is still valid. When
+    GATEWAY_TOKEN_PREFETCH=1, a daemon timer refreshes the token one minute
+    before it expires so requests never block on the refresh.
     """
 
-    def __init__(self):
+    def __init__(self, config: GatewayConfig | None = None):
         """
         Initialize the token manager.
 
-        Credentials are loaded from SSM Parameter Store using the project
-        name from AGENTIFY_PROJECT_NAME environment variable.
+        Args:
+            config: Pre-fetched Gateway config. When omitted, credentials are
+                loaded from SSM Parameter Store using the project name from
+                AGENTIFY_PROJECT_NAME environment variable.
         """
-        config = _get_gateway_config_from_ssm()
+        if config is None:
+            config = _get_gateway_config_from_ssm()
         if config:
             self.client_id = config.get('client_id')
             self.client_secret = config.get('client_secret')
@@ -166,8 +287,30 @@ class GatewayTokenManager:
             self.token_endpoint = None
             self.scope = None
 
-        self._token: str | None = None
-        self._expires_at: datetime | None = None
+        # Token request is identical on every refresh, so encode it once
+        self._token_post_data = {
+            'grant_type': 'client_credentials',
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'scope': self.scope,
+        }
+        self._token_body = urlencode(
+            {k: v for k, v in self._token_post_data.items() if v is not None}
+        ).encode('ascii')
+        self._token_post_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+        # Minimum margin kept between refresh and actual token expiry
+        self._expiry_buffer_s = int(os.environ.get('GATEWAY_OAUTH_EXPIRY_BUFFER', '300'))
+
+        # (token, monotonic deadline) swapped as one object so lock-free
+        # readers never see a token paired with another token's deadline.
+        # Monotonic time is immune to wall-clock (NTP) adjustments.
+        self._cached: tuple[str, float] | None = None
+        self._refresh_lock = threading.Lock()
+        self._prefetch_timer: threading.Timer | None = None
+        self._closed = False
+
+        self._load_persisted_token()
 
     def is_configured(self) -> bool:
         """
@@ -176,7 +319,7 @@ class GatewayTokenManager:
         Returns:
             True if all required credentials are present, False otherwise.
         """
-        return all([self.client_id, self.client_secret, self.token_endpoint, self.scope])
+        return bool(self.client_id and self.client_secret and self.token_endpoint and self.scope)
 
     def get_token(self) -> str:
         """
@@ -184,7 +327,10 @@ class GatewayTokenManager:
 
         This method returns a cached token if still valid, or fetches a new
         token from Cognito using the client credentials grant. Tokens are
-        refreshed 5 minutes before expiry to avoid authentication failures.
+        refreshed after ~75% of their lifetime to avoid authentication failures.
+
+        Thread-safe: the valid-token path takes no lock, and only one thread
+        performs the refresh when the token is missing or expired.
 
         Returns:
             A valid OAuth access token string.
@@ -193,35 +339,142 @@ class GatewayTokenManager:
             ValueError: If OAuth credentials are not configured.
             httpx.HTTPStatusError: If token request fails.
         """
-        # Return cached token if still valid
-        if self._token and self._expires_at and self._expires_at > datetime.now():
-            return self._token
-
+        # Return cached token if still valid (lock-free fast path)
+        cached = self._cached
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        with self._refresh_lock:
+            # Re-check: another thread may have refreshed while we waited
+            cached = self._cached
+            if cached is not None and time.monotonic() < cached[1]:
+                return cached[0]
+            return self._refresh_token()
+
+    def _refresh_token(self) -> str:
+        """Fetch a new token from Cognito. Caller must hold self._refresh_lock."""
         if not self.is_configured():
             raise ValueError('Gateway OAuth credentials not configured')
 
         logger.info('Fetching new OAuth token from %s', self.token_endpoint)
 
-        response = httpx.post(
+        response = _get_http_client().post(
             self.token_endpoint,
-            data={
-                'grant_type': 'client_credentials',
-                'client_id': self.client_id,
-                'client_secret': self.client_secret,
-                'scope': self.scope,
-            },
-            headers={'Content-Type': 'application/x-www-form-urlencoded'},
+            content=self._token_body,
+            headers=self._token_post_headers,
         )
         response.raise_for_status()
-        data = response.json()
-
-        self._token = data['access_token']
-        # Refresh 5 minutes before actual expiry to avoid edge cases
-        expires_in = data.get('expires_in', 3600) - 300
-        self._expires_at = datetime.now() + timedelta(seconds=expires_in)
+        data = _json_loads(response.content)
+
+        token = data['access_token']
+        # Refresh at ~75% of the lifetime, jittered to spread refreshes out,
+        # but never later than the configured buffer before real expiry
+        lifetime = data.get('expires_in', 3600)
+        expires_in = max(1, min(
+            int(lifetime * 0.75) + random.randint(-30, 30),
+            lifetime - self._expiry_buffer_s,
+        ))
+        self._cached = (token, time.monotonic() + expires_in)
+        self._persist_token(token, expires_in)
+        self._schedule_prefetch(expires_in)
 
         logger.info('OAuth token obtained, expires in %d seconds', expires_in)
-        return self._token
+        return token
+
+    def _schedule_prefetch(self, expires_in: float) -> None:
+        """Schedule a background refresh shortly before the token expires."""
+        if not TOKEN_PREFETCH_ENABLED or self._closed:
+            return
+
+        self._cancel_prefetch()
+
+        delay = max(1.0, expires_in - TOKEN_PREFETCH_LEAD_SECONDS)
+        timer = threading.Timer(delay, self._background_refresh)
+        timer.daemon = True
+        timer.start()
+        self._prefetch_timer = timer
+
+    def _cancel_prefetch(self) -> None:
+        """Cancel the pending background refresh, if any."""
+        timer = self._prefetch_timer
+        if timer is not None:
+            timer.cancel()
+            self._prefetch_timer = None
+
+    def _background_refresh(self) -> None:
+        """Refresh the token off the request path (runs on the prefetch timer)."""
+        # A replaced or closed manager must not keep refreshing (and rescheduling)
+        if self._closed or _token_manager is not self:
+            return
+
+        with self._refresh_lock:
+            try:
+                self._refresh_token()
+            except Exception as e:
+                # Next get_token() call will retry the refresh synchronously
+                logger.warning('Background OAuth token refresh failed: %s', e)
+
+    def _load_persisted_token(self) -> None:
+        """Seed the in-memory token from TOKEN_CACHE_FILE if it is still valid."""
+        if not TOKEN_CACHE_FILE or not self.client_id:
+            return
+
+        try:
+            with open(TOKEN_CACHE_FILE, encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        # Only reuse tokens issued to the same Cognito client
+        if not isinstance(cached, dict) or cached.get('client_id') != self.client_id:
+            return
+
+        # Ignore malformed entries rather than failing token acquisition
+        token = cached.get('access_token')
+        refresh_at = cached.get('refresh_at')
+        if (
+            not isinstance(token, str)
+            or not isinstance(refresh_at, (int, float))
+            or isinstance(refresh_at, bool)
+        ):
+            return
+
+        remaining = refresh_at - time.time()
+        if token and remaining > 0:
+            self._cached = (token, time.monotonic() + remaining)
+            logger.info('Reusing persisted OAuth token, expires in %d seconds', remaining)
+
+    def _persist_token(self, token: str, expires_in: float) -> None:
+        """Write the current token to TOKEN_CACHE_FILE (mode 0600), if enabled."""
+        if not TOKEN_CACHE_FILE:
+            return
+
+        # mkstemp creates a fresh 0600 file (O_EXCL, so never through a
+        # symlink) and os.replace swaps it in atomically, so readers never
+        # see a partial write and a planted symlink is replaced, not followed
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(TOKEN_CACHE_FILE)),
+                prefix='.agentify_token_',
+            )
+        except OSError as e:
+            logger.debug('Could not persist OAuth token: %s', e)
+            return
+
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'client_id': self.client_id,
+                    'access_token': token,
+                    'refresh_at': time.time() + expires_in,
+                }, f)
+            os.replace(tmp_path, TOKEN_CACHE_FILE)
+        except OSError as e:
+            logger.debug('Could not persist OAuth token: %s', e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
     def clear_token(self) -> None:
         """
@@ -230,19 +483,140 @@ class GatewayTokenManager:
         Call this method to force a token refresh on the next get_token() call.
         Useful when a token is rejected by the Gateway.
         """
-        self._token = None
-        self._expires_at = None
+        self._cached = None
+        # The next get_token() refreshes and schedules a new prefetch
+        self._cancel_prefetch()
         logger.debug('Cleared cached OAuth token')
 
+    def close(self) -> None:
+        """
+        Stop background token refreshes for this manager.
+
+        Called when the shared manager is replaced so the old one stops
+        hitting Cognito. get_token() still works but never schedules a prefetch.
+        """
+        self._closed = True
+        self._cancel_prefetch()
+
+    def token_deadline(self) -> float | None:
+        """
+        Get the time.monotonic() deadline at which the cached token is refreshed.
+
+        Returns:
+            Monotonic deadline, or None if no token is cached
+        """
+        cached = self._cached
+        return cached[1] if cached else None
+
+
+_token_manager: GatewayTokenManager | None = None
+_token_manager_config: GatewayConfig | None = None
+_token_manager_lock = threading.Lock()
+
+
+def _get_token_manager(config: GatewayConfig | None = None) -> GatewayTokenManager:
+    """
+    Get the process-wide GatewayTokenManager.
+
+    Sharing one manager lets the cached OAuth token survive across agent
+    invocations in a warm container instead of hitting Cognito every time.
+    The manager is only rebuilt when the SSM config changes (e.g. rotated
+    client credentials), so an unchanged re-read keeps the cached token.
+
+    Args:
+        config: Gateway config the caller already fetched (read from SSM if omitted)
+    """
+    global _token_manager, _token_manager_config
+    if config is None:
+        config = _get_gateway_config_from_ssm()
+
+    with _token_manager_lock:
+        if _token_manager is None or config != _token_manager_config:
+            if _token_manager is not None:
+                _token_manager.close()
+            _token_manager = GatewayTokenManager(config)
+            _token_manager_config = config
+        return _token_manager
+
+
+def clear_gateway_token() -> None:
+    """Force the shared token manager to fetch a new token on next use."""
+    _get_token_manager().clear_token()
+
+
+# iterencode() without one-shot mode yields chunks as it walks containers,
+# so encoding can stop part-way through a large nested value
+_incremental_json_encoder = json.JSONEncoder()
+
+
+def _encode_json_prefix(value, limit: int) -> str:
+    """Encode value as JSON, stopping once more than limit characters are produced."""
+    if not isinstance(value, (dict, list, tuple)):
+        return json.dumps(value)
+
+    chunks = []
+    length = 0
+    for chunk in _incremental_json_encoder.iterencode(value):
+        chunks.append(chunk)
+        length += len(chunk)
+        if length > limit:
+            break
+    return ''.join(chunks)
+
+
+def _truncate_tool_input(input_data) -> str:
+    """
+    Serialize tool input as JSON, truncated to TOOL_INPUT_MAX_CHARS.
+
+    Dict inputs are serialized key by key and serialization stops once the
+    limit is reached, so a large payload is never encoded in full just to
+    keep its first few hundred characters. Nested lists and dicts are
+    encoded incrementally and cut off at the remaining budget as well.
+
+    Args:
+        input_data: Tool input from the tool_use block
+
+    Returns:
+        JSON string, ending in '...' if truncated
+    """
+    if not input_data:
+        return '{}'
+
+    if isinstance(input_data, dict):
+        parts = []
+        length = 1  # Opening brace
+        for key, value in input_data.items():
+            if isinstance(value, str) and len(value) > TOOL_INPUT_MAX_CHARS:
+                value = value[:TOOL_INPUT_MAX_CHARS]
+            # JSON object keys must be strings; coerce like json.dumps does
+            # (True -> "true", None -> "null", 1 -> "1")
+            if not isinstance(key, str):
+                key = json.dumps(key) if key is None or isinstance(key, (bool, int, float)) else str(key)
+            part = f'{json.dumps(key)}: {_encode_json_prefix(value, TOOL_INPUT_MAX_CHARS - length)}'
+            parts.append(part)
+            length += len(part) + 2  # Separator
+            if length > TOOL_INPUT_MAX_CHARS:
+                break
+        input_str = '{' + ', '.join(parts) + '}'
+    else:
+        input_str = _encode_json_prefix(input_data, TOOL_INPUT_MAX_CHARS)
+
+    if len(input_str) > TOOL_INPUT_MAX_CHARS:
+        input_str = f'{input_str[:TOOL_INPUT_MAX_CHARS - 3]}...'
+    return input_str
+
 
 def _create_instrumented_stream(original_stream, tool_name: str):
     """
     Create an instrumented async generator that wraps the original tool's stream method.
 
     Strands tools use stream() method which is an async generator. This wrapper:
-    1. Emits 'started' event to DynamoDB before yielding any events
+    1. Queues a 'started' event before yielding any events
     2. Yields all events from the original stream
-    3. Emits 'completed' or 'failed' event when the stream finishes
+    3. Queues a 'completed' or 'failed' event when the stream finishes
+
+    Events are written by the dynamodb_client background writer, which batches
+    them, so the tool call never waits on DynamoDB.
 
     IMPORTANT: Uses try/finally to ensure completion event is ALWAYS written,
     even if the consumer doesn't fully exhaust the generator (e.g., due to
@@ -255,6 +629,15 @@ def _create_instrumented_stream(original_stream, tool_name: str):
     Returns:
         Async generator function that wraps the original stream with instrumentation
     """
+    # Per-tool constants bound once per wrap: one template per status and
+    # closure locals for the functions called on every tool call
+    event_template = {'event_type': 'tool_call', 'system': 'gateway', 'operation': tool_name}
+    started_template = {**event_template, 'status': 'started'}
+    completed_template = {**event_template, 'status': 'completed'}
+    failed_template = {**event_template, 'status': 'failed'}
+    time_ns = time.time_ns
+    enqueue = enqueue_tool_event
+
     async def instrumented_stream(tool_use, invocation_state=None, **kwargs):
         """Instrumented stream method for MCPAgentTool."""
         # Check if instrumentation context is set
@@ -267,34 +650,29 @@ def _create_instrumented_stream(original_stream, tool_name: str):
             return
 
         # Generate event ID and timestamps
-        event_id = str(uuid.uuid4())
-        start_time = datetime.now(timezone.utc)
-        start_timestamp = int(start_time.timestamp() * 1000)
+        event_id = new_event_id()
+        start_ns = time_ns()
+        start_timestamp = start_ns // 1_000_000
 
         # Prepare input (truncated)
-        import json
         try:
             input_data = tool_use.get('input', {}) if isinstance(tool_use, dict) else {}
-            input_str = json.dumps(input_data)
-            if len(input_str) > 200:
-                input_str = input_str[:197] + '...'
+            input_str = _truncate_tool_input(input_data)
         except Exception:
             input_str = '{}'
 
-        # Write 'started' event
+        # Fields identifying this call in its started and terminal events
+        call_fields = {'workflow_id': session_id, 'event_id': event_id, 'agent_name': agent_name}
+
+        # Queue 'started' event
         started_event = {
-            'workflow_id': session_id,
+            **started_template,
+            **call_fields,
             'timestamp': start_timestamp,
-            'event_type': 'tool_call',
-            'event_id': event_id,
-            'agent_name': agent_name,
-            'system': 'gateway',
-            'operation': tool_name,
             'input': input_str,
-            'status': 'started',
         }
-        write_tool_event(started_event)
-        logger.info('Gateway tool %s started event written for session %s', tool_name, session_id)
+        enqueue(started_event)
+        logger.info('Gateway tool %s started event queued for session %s', tool_name, session_id)
 
         # Track whether we completed successfully or had an error
         error_occurred = None
@@ -317,50 +695,52 @@ def _create_instrumented_stream(original_stream, tool_name: str):
             raise
 
         finally:
-            # ALWAYS write completion event (success or failure)
-            end_time = datetime.now(timezone.utc)
-            duration_ms = int((end_time - start_time).total_seconds() * 1000)
+            # ALWAYS queue completion event (success or failure)
+            end_timestamp = time_ns() // 1_000_000
+            duration_ms = end_timestamp - start_timestamp
 
             if error_occurred is not None:
                 # Truncate error message
                 error_msg = str(error_occurred)
-                if len(error_msg) > 500:
-                    error_msg = error_msg[:497] + '...'
+                if len(error_msg) > TOOL_ERROR_MAX_CHARS:
+                    error_msg = f'{error_msg[:TOOL_ERROR_MAX_CHARS - 3]}...'
 
-                # Write 'failed' event
+                # Queue 'failed' event
                 error_event = {
-                    'workflow_id': session_id,
-                    'timestamp': int(end_time.timestamp() * 1000),
-                    'event_type': 'tool_call',
-                    'event_id': event_id,
-                    'agent_name': agent_name,
-                    'system': 'gateway',
-                    'operation': tool_name,
-                    'status': 'failed',
+                    **failed_template,
+                    **call_fields,
+                    'timestamp': end_timestamp,
                     'duration_ms': duration_ms,
                     'error_message': error_msg,
                 }
-                write_tool_event(error_event)
-                logger.info('Gateway tool %s failed event written, duration: %dms', tool_name, duration_ms)
+                enqueue(error_event)
+                logger.info('Gateway tool %s failed event queued, duration: %dms', tool_name, duration_ms)
             else:
-                # Write 'completed' event
+                # Queue 'completed' event
                 completed_event = {
-                    'workflow_id': session_id,
-                    'timestamp': int(end_time.timestamp() * 1000),
-                    'event_type': 'tool_call',
-                    'event_id': event_id,
-                    'agent_name': agent_name,
-                    'system': 'gateway',
-                    'operation': tool_name,
-                    'status': 'completed',
+                    **completed_template,
+                    **call_fields,
+                    'timestamp': end_timestamp,
                     'duration_ms': duration_ms,
                 }
-                write_tool_event(completed_event)
-                logger.info('Gateway tool %s completed event written, duration: %dms', tool_name, duration_ms)
+                enqueue(completed_event)
+                logger.info('Gateway tool %s completed event queued, duration: %dms', tool_name, duration_ms)
 
+    # Marks the wrapper so an already instrumented tool is never wrapped twice
+    instrumented_stream._agentify_instrumented = True
     return instrumented_stream
 
 
+# Name locations in preference order: direct 'name', 'tool_name', nested
+# 'tool.name' (MCP schema structure), then '__name__' (function-like objects)
+_TOOL_NAME_GETTERS = (
+    attrgetter('name'),
+    attrgetter('tool_name'),
+    attrgetter('tool.name'),
+    attrgetter('__name__'),
+)
+
+
 def _get_mcp_tool_name(tool) -> str:
     """
     Extract the tool name from an MCP tool object.
@@ -374,21 +754,13 @@ def _get_mcp_tool_name(tool) -> str:
     Returns:
         Tool name string, or 'unknown_tool' if not found
     """
-    # Try direct 'name' attribute (preferred)
-    if hasattr(tool, 'name') and isinstance(tool.name, str):
-        return tool.name
-
-    # Try 'tool_name' attribute
-    if hasattr(tool, 'tool_name') and isinstance(tool.tool_name, str):
-        return tool.tool_name
-
-    # Try nested 'tool.name' (MCP schema structure)
-    if hasattr(tool, 'tool') and hasattr(tool.tool, 'name'):
-        return tool.tool.name
-
-    # Try '__name__' (function-like objects)
-    if hasattr(tool, '__name__') and isinstance(tool.__name__, str):
-        return tool.__name__
+    for get_name in _TOOL_NAME_GETTERS:
+        try:
+            name = get_name(tool)
+        except AttributeError:
+            continue
+        if isinstance(name, str):
+            return name
 
     # Last resort: return unknown rather than Python repr
     logger.warning('Could not extract name from MCP tool: %s', type(tool).__name__)
@@ -404,6 +776,9 @@ def _instrument_gateway_tools(gateway_tools: list) -> list:
     stream method with an instrumented version. This preserves the tool's
     type and all other attributes, avoiding Strands registry issues.
 
+    Tools whose stream is already instrumented are left as they are, so
+    instrumenting the same tool proxies again is a no-op.
+
     Args:
         gateway_tools: List of MCPAgentTool proxy objects
 
@@ -411,18 +786,198 @@ def _instrument_gateway_tools(gateway_tools: list) -> list:
         Same list (tools are modified in place)
     """
     for tool in gateway_tools:
-        tool_name = _get_mcp_tool_name(tool)
-        if hasattr(tool, 'stream'):
-            # Monkey-patch the stream method with instrumented version
+        try:
             original_stream = tool.stream
-            tool.stream = _create_instrumented_stream(original_stream, tool_name)
-            logger.debug('Instrumented Gateway tool: %s', tool_name)
-        else:
-            logger.warning('Gateway tool %s has no stream method, skipping instrumentation', tool_name)
+        except AttributeError:
+            logger.warning(
+                'Gateway tool %s has no stream method, skipping instrumentation',
+                _get_mcp_tool_name(tool),
+            )
+            continue
+
+        try:
+            if original_stream._agentify_instrumented:
+                continue
+        except AttributeError:
+            pass
+
+        # Monkey-patch the stream method with instrumented version
+        tool_name = _get_mcp_tool_name(tool)
+        tool.stream = _create_instrumented_stream(original_stream, tool_name)
+        logger.debug('Instrumented Gateway tool: %s', tool_name)
 
     return gateway_tools
 
 
+@lru_cache(maxsize=4)
+def _get_bedrock_model(model_id: str | None) -> BedrockModel:
+    """
+    Get a BedrockModel for the given model ID, memoized per process.
+
+    BedrockModel builds a boto3 Bedrock runtime client on construction, which
+    is too expensive to repeat on every invocation.
+
+    Agents are deliberately not cached: an Agent accumulates conversation
+    history in agent.messages, so reusing one would leak an invocation's
+    prompt and tool results into the next. With the model (and its client)
+    reused, building the Agent wrapper itself is cheap.
+    """
+    if model_id:
+        logger.debug('Created BedrockModel with ID: %s', model_id)
+        return BedrockModel(model_id=model_id)
+    logger.debug('Created BedrockModel with default configuration')
+    return BedrockModel()
+
+
+def _is_auth_error(error: BaseException | None) -> bool:
+    """Check whether an exception, or anything in its cause chain, is an HTTP 401."""
+    while error is not None:
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 401:
+            return True
+        message = str(error)
+        if '401' in message or 'Unauthorized' in message:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class _GatewaySession:
+    """An open MCP session plus the Gateway tools listed from it.
+
+    Invocations lease the session while their agent runs. A retired session
+    is no longer handed out and is closed once its last lease is released,
+    so a concurrent invocation never loses the session under its tool calls.
+    """
+
+    __slots__ = ('client', 'tools', 'url', 'expires', 'instrumented', 'leases', 'retired')
+
+    def __init__(self, client, tools: list, url: str, expires: float):
+        self.client = client
+        self.tools = tools
+        self.url = url
+        self.expires = expires
+        self.instrumented = False
+        self.leases = 0
+        self.retired = False
+
+    def close(self) -> None:
+        try:
+            self.client.__exit__(None, None, None)
+        except Exception as e:
+            logger.debug('Error closing cached MCP session: %s', e)
+
+
+_mcp_session: _GatewaySession | None = None
+_mcp_session_lock = threading.Lock()
+
+
+def _retire_gateway_session(session: _GatewaySession) -> None:
+    """Stop handing out a session and close it if no invocation holds it.
+
+    Must be called with _mcp_session_lock held.
+    """
+    global _mcp_session
+    if _mcp_session is session:
+        _mcp_session = None
+    session.retired = True
+    if session.leases == 0:
+        session.close()
+
+
+def _close_gateway_session() -> None:
+    """Retire the cached MCP session, if any."""
+    with _mcp_session_lock:
+        if _mcp_session is not None:
+            _retire_gateway_session(_mcp_session)
+
+
+atexit.register(_close_gateway_session)
+
+
+def _acquire_gateway_session(
+    gateway_url: str,
+    create_client,
+    token_manager: GatewayTokenManager | None = None,
+) -> _GatewaySession:
+    """
+    Lease a cached, open MCP session with instrumented Gateway tools.
+
+    The session is entered once and kept open across invocations so warm
+    containers skip the MCP handshake and list_tools_sync() round-trip.
+    It is rebuilt when the Gateway URL changes or the cache TTL expires.
+    The session's transport carries the bearer token it was opened with, so
+    an authenticated session also expires when that token is due for refresh
+    rather than being reused until the Gateway answers 401.
+
+    Every lease must be returned with _release_gateway_session(). An expired
+    or failed session is only retired: invocations already holding it keep
+    using it, and it is closed when the last of them releases it.
+
+    Tools are only wrapped for DynamoDB events once an invocation runs with
+    an instrumentation context, so uninstrumented runs (e.g. local dev) call
+    the original stream methods with no extra generator layer.
+
+    Args:
+        gateway_url: Gateway endpoint the session must belong to
+        create_client: Zero-argument factory returning a new MCPClient
+        token_manager: Token manager whose token the session authenticates with
+
+    Returns:
+        The leased session; its tools are MCP proxies bound to it
+    """
+    global _mcp_session
+    with _mcp_session_lock:
+        session = _mcp_session
+        if (
+            session is not None
+            and session.url == gateway_url
+            and time.monotonic() < session.expires
+        ):
+            logger.debug('Reusing cached Gateway session with %d tools', len(session.tools))
+        else:
+            if session is not None:
+                _retire_gateway_session(session)
+
+            client = create_client()
+            client.__enter__()
+            try:
+                gateway_tools = client.list_tools_sync()
+                logger.info('Loaded %d tools from Gateway', len(gateway_tools))
+            except Exception:
+                client.__exit__(None, None, None)
+                raise
+
+            expires = time.monotonic() + MCP_SESSION_CACHE_TTL_SECONDS
+            token_deadline = token_manager.token_deadline() if token_manager else None
+            if token_deadline is not None:
+                expires = min(expires, token_deadline)
+
+            session = _mcp_session = _GatewaySession(client, gateway_tools, gateway_url, expires)
+
+        if not session.instrumented and all(get_instrumentation_context()):
+            # Instrument Gateway tools to emit events to DynamoDB
+            _instrument_gateway_tools(session.tools)
+            session.instrumented = True
+            logger.debug('Instrumented %d Gateway tools for observability', len(session.tools))
+
+        session.leases += 1
+        return session
+
+
+def _release_gateway_session(session: _GatewaySession, failed: bool = False) -> None:
+    """
+    Return a lease taken by _acquire_gateway_session().
+
+    Args:
+        session: The leased session
+        failed: Retire the session so later invocations reconnect
+    """
+    with _mcp_session_lock:
+        session.leases -= 1
+        if failed or session.retired:
+            _retire_gateway_session(session)
+
+
 def invoke_with_gateway(
     prompt: str,
     local_tools: list,
@@ -471,19 +1026,20 @@ def invoke_with_gateway(
         ...     )
     """
     # Input validation
-    if not prompt or not prompt.strip():
+    # isspace() scans in place instead of allocating a stripped copy
+    if not prompt or prompt.isspace():
         raise ValueError('Prompt cannot be empty')
 
-    # Get model ID from environment
-    model_id = model_id or os.environ.get('AGENT_MODEL_ID')
+    # Fall back to the AGENT_MODEL_ID snapshot taken at import
+    model_id = model_id or _DEFAULT_MODEL_ID
 
-    # Create model
-    if model_id:
-        model = BedrockModel(model_id=model_id)
-        logger.debug('Created BedrockModel with ID: %s', model_id)
-    else:
-        model = BedrockModel()
-        logger.debug('Created BedrockModel with default configuration')
+    # Reuse the model (and its Bedrock runtime client) across invocations
+    model = _get_bedrock_model(model_id)
+
+    def run(tools: list) -> str:
+        # Agents keep conversation history, so each run gets a fresh one
+        agent = Agent(model=model, system_prompt=system_prompt, tools=tools)
+        return agent(prompt).message
 
     # Get Gateway URL from SSM config
     gateway_config = _get_gateway_config_from_ssm()
@@ -492,14 +1048,17 @@ def invoke_with_gateway(
     # Case 1: No Gateway - local tools only
     if not gateway_url:
         logger.info('No Gateway URL configured, using local tools only')
-        agent = Agent(model=model, system_prompt=system_prompt, tools=local_tools)
-        result = agent(prompt)
-        return result.message
+        return run(local_tools)
 
     # Case 2: Gateway configured - manage MCP session lifecycle
+    # Lazy imports: the MCP stack is only loaded when a Gateway is configured
+    from mcp.client.streamable_http import streamablehttp_client
+    from strands.tools.mcp import MCPClient
+
     logger.info('Connecting to Gateway at %s', gateway_url)
 
-    token_manager = GatewayTokenManager()
+    # Reuse the config fetched above instead of reading it again
+    token_manager = _get_token_manager(gateway_config)
 
     if token_manager.is_configured():
         # Create authenticated transport factory
@@ -512,40 +1071,45 @@ def invoke_with_gateway(
                 headers={'Authorization': f'Bearer {token}'}
             )
 
-        client = MCPClient(create_authenticated_transport)
-        logger.info('Gateway OAuth credentials configured, using authenticated connection')
+        def create_client():
+            logger.info('Gateway OAuth credentials configured, using authenticated connection')
+            return MCPClient(create_authenticated_transport)
     else:
         # Fallback to unauthenticated (will likely get 401)
-        logger.warning('Gateway OAuth credentials not configured, attempting unauthenticated connection')
-        client = MCPClient(lambda: streamablehttp_client(gateway_url))
+        def create_client():
+            logger.warning('Gateway OAuth credentials not configured, attempting unauthenticated connection')
+            return MCPClient(lambda: streamablehttp_client(gateway_url))
 
+    session = None
     try:
-        # CRITICAL: Keep session open during entire agent execution
-        # Tools are proxy objects that reference this session
-        with client:
-            gateway_tools = client.list_tools_sync()
-            logger.info('Loaded %d tools from Gateway', len(gateway_tools))
-
-            # Instrument Gateway tools to emit events to DynamoDB
-            gateway_tools = _instrument_gateway_tools(gateway_tools)
-            logger.debug('Instrumented %d Gateway tools for observability', len(gateway_tools))
-
-            all_tools = local_tools + gateway_tools
-            logger.info('Created agent with %d total tools', len(all_tools))
-
-            agent = Agent(model=model, system_prompt=system_prompt, tools=all_tools)
-
-            # Tool calls happen HERE with session OPEN
-            result = agent(prompt)
+        # CRITICAL: The session stays open during the entire agent execution
+        # (and is cached for later invocations). Tools are proxy objects that
+        # reference this session.
+        try:
+            session = _acquire_gateway_session(gateway_url, create_client, token_manager)
+        except Exception as e:
+            # A rotated/revoked token shows up as a 401 - refresh and retry once
+            if not token_manager.is_configured() or not _is_auth_error(e):
+                raise
+            logger.info('Gateway rejected OAuth token (%s), retrying with a fresh token', e)
+            token_manager.clear_token()
+            session = _acquire_gateway_session(gateway_url, create_client, token_manager)
 
-            # Session still OPEN when we access result
-            return result.message
+        all_tools = local_tools + session.tools
+        logger.info('Created agent with %d total tools', len(all_tools))
 
-        # Session closes AFTER agent completes and we've extracted the message
+        # Tool calls happen HERE with session OPEN
+        return run(all_tools)
 
     except Exception as e:
         logger.warning('Gateway failed: %s. Falling back to local tools.', e)
+        # Retire the cached session so the next invocation reconnects
+        if session is not None:
+            _release_gateway_session(session, failed=True)
+            session = None
         # Graceful degradation - try with local tools only
-        agent = Agent(model=model, system_prompt=system_prompt, tools=local_tools)
-        result = agent(prompt)
-        return result.message
+        return run(local_tools)
+
+    finally:
+        if session is not None:
+            _release_gateway_session(session)
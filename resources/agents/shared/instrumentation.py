@@ -35,38 +35,82 @@ finally:
 
 The @instrument_tool decorator emits three types of events:
 
-1. **started**: Written before tool execution begins
-2. **completed**: Written after successful execution with duration
-3. **error**: Written after failure with duration and error message
+1. **started**: Queued before tool execution begins
+2. **completed**: Queued after successful execution with duration
+3. **error**: Queued after failure with duration and error message
+
+Tools that usually finish in under FAST_TOOL_THRESHOLD_MS skip the started event;
+their terminal event carries the input and `started_implicit: True`.
 
 Events are only emitted when valid context is available. If no context is set,
 tools execute normally without any monitoring overhead.
 
 ## Thread Safety
 
-This module uses module-level globals for context storage, which is safe in
-AgentCore containers that handle one request at a time. The context isolation
-prevents interference between concurrent requests in multi-threaded environments.
+Context is stored in a contextvars.ContextVar, so concurrent requests handled
+by different asyncio tasks or threads each see their own context. Strands runs
+the agent loop in a copy of the caller's context and sync tools through
+asyncio.to_thread(), which copies it again, so tools see the context set by
+their handler. Code that starts its own worker threads must run them in
+contextvars.copy_context() for their tool calls to emit events.
+
+The context is validated once when set and stored as a (session_id, agent_name)
+tuple, so the per-tool-call check is a single lookup.
 
 ## Integration with DynamoDB Client
 
 The instrumentation system integrates with the DynamoDB client module for
-event persistence. All write operations use the fire-and-forget pattern
-implemented in agents.shared.dynamodb_client.write_tool_event().
+event persistence. Events are handed to
+agents.shared.dynamodb_client.enqueue_tool_event(), whose background writer
+thread sends them in BatchWriteItem requests of up to 25 events, so tool
+calls never wait on DynamoDB. Queued events are flushed at interpreter exit.
 """
 
+from contextvars import ContextVar
 from typing import Callable, TypeVar, ParamSpec
 from functools import wraps
+from itertools import count, islice
+import json
+import time
 import uuid
-from datetime import datetime, timezone
+
+try:
+    from orjson import dumps as _orjson_dumps
+
+    def _json_dumps(obj) -> str:
+        return _orjson_dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to stdlib json
+    _json_dumps = json.dumps
 
 P = ParamSpec('P')
 R = TypeVar('R')
 
-# Module-level globals for context storage
-# These are safe in AgentCore containers which handle one request at a time
-_session_id: str | None = None
-_agent_name: str | None = None
+# Bounds on recorded tool parameters: argument count and characters per value
+MAX_RECORDED_ARGS = 16
+MAX_PARAM_CHARS = 100
+
+# Tools whose smoothed runtime is below this skip the separate 'started' event;
+# their terminal event carries the input and started_implicit=True instead
+FAST_TOOL_THRESHOLD_MS = 5
+FAST_TOOL_EWMA_ALPHA = 0.1  # Weight of the latest call in the smoothed runtime
+
+# Validated (session_id, agent_name) for the current request, or None
+_context: ContextVar[tuple[str, str] | None] = ContextVar(
+    'agentify_instrumentation_context', default=None
+)
+
+# Event IDs are a random per-process prefix plus a counter: unique without
+# reading the OS CSPRNG on every tool call
+_event_id_prefix = uuid.uuid4().hex[:16]
+_event_id_counter = count(1)
+
+# dynamodb_client.enqueue_tool_event, bound on first instrumented call
+_enqueue_tool_event: Callable[[dict], None] | None = None
+
+
+def new_event_id() -> str:
+    """Return a process-unique tool event ID (shared by all tool instrumentation)."""
+    return f'{_event_id_prefix}{next(_event_id_counter):08x}'
 
 
 def instrument_tool(func: Callable[P, R]) -> Callable[P, R]:
@@ -78,9 +122,9 @@ def instrument_tool(func: Callable[P, R]) -> Callable[P, R]:
     to ensure monitoring never blocks tool execution.
 
     The decorator emits three types of events:
-    - 'started': Written before tool execution begins
-    - 'completed': Written after successful tool execution with duration
-    - 'error': Written after tool failure with duration and error message
+    - 'started': Queued before tool execution begins
+    - 'completed': Queued after successful tool execution with duration
+    - 'error': Queued after tool failure with duration and error message
 
     Events are only emitted when instrumentation context is set via
     set_instrumentation_context(). If no context is available, the tool
@@ -132,93 +176,120 @@ def instrument_tool(func: Callable[P, R]) -> Callable[P, R]:
     """
     tool_name = func.__name__
 
+    # Static event fields, built once per decorated tool
+    # Format matches TypeScript ToolCallEvent interface
+    event_template = {
+        'event_type': 'tool_call',  # Required for TypeScript type guard
+        'system': 'agent',  # Default system for agent tools
+        'operation': tool_name,  # Tool function name
+    }
+    started_template = {**event_template, 'status': 'started'}
+    completed_template = {**event_template, 'status': 'completed'}
+    failed_template = {**event_template, 'status': 'failed'}  # TypeScript uses 'failed' not 'error'
+
+    # Smoothed runtime of this tool, None until its first instrumented call
+    avg_duration_ms: float | None = None
+
+    def record_duration(duration_ms: int) -> None:
+        nonlocal avg_duration_ms
+        if avg_duration_ms is None:
+            avg_duration_ms = float(duration_ms)
+        else:
+            avg_duration_ms += FAST_TOOL_EWMA_ALPHA * (duration_ms - avg_duration_ms)
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        # Check if we should emit events
-        if not _should_emit_events():
+        # Context is validated when set, so None is the only check needed
+        context = _context.get()
+        if context is None:
             # No context = no events, just execute tool
             return func(*args, **kwargs)
 
-        # Get context for event attribution
-        session_id, agent_name = get_instrumentation_context()
+        # Context for event attribution
+        session_id, agent_name = context
 
         # Generate unique event ID
-        event_id = str(uuid.uuid4())
+        event_id = new_event_id()
 
         # Record start time (epoch milliseconds for DynamoDB sort key)
-        start_time = datetime.now(timezone.utc)
-        start_timestamp = int(start_time.timestamp() * 1000)
+        # Duration comes from the monotonic clock; the end timestamp is derived
+        # from it, so wall-clock time is read once per call
+        start_timestamp = time.time_ns() // 1_000_000
+        start_ns = time.perf_counter_ns()
 
         # Prepare parameters (truncated for storage)
-        params = {}
-        if args:
-            params['args'] = [str(a)[:100] for a in args]
-        if kwargs:
-            params['kwargs'] = {k: str(v)[:100] for k, v in kwargs.items()}
-
-        # Import here to avoid circular dependency
-        from agents.shared.dynamodb_client import write_tool_event
-
-        # Write 'started' event (fire-and-forget)
-        # Format matches TypeScript ToolCallEvent interface
-        started_event = {
+        # No-argument tools skip building and serializing a params dict
+        if not args and not kwargs:
+            input_str = '{}'
+        else:
+            params = {}
+            if args:
+                params['args'] = [str(a)[:MAX_PARAM_CHARS] for a in islice(args, MAX_RECORDED_ARGS)]
+            if kwargs:
+                params['kwargs'] = {
+                    k: str(v)[:MAX_PARAM_CHARS] for k, v in islice(kwargs.items(), MAX_RECORDED_ARGS)
+                }
+            input_str = _truncate_json(params)
+
+        enqueue_tool_event = _enqueue_tool_event or _bind_event_writer()
+
+        # Fields identifying this call in all of its events
+        call_fields = {
             'workflow_id': session_id,  # DynamoDB uses workflow_id as partition key
-            'timestamp': start_timestamp,
-            'event_type': 'tool_call',  # Required for TypeScript type guard
             'event_id': event_id,
             'agent_name': agent_name,  # Matches TypeScript ToolCallEvent
-            'system': 'agent',  # Default system for agent tools
-            'operation': tool_name,  # Tool function name
-            'input': _truncate_json(params),  # Matches TypeScript ToolCallEvent
-            'status': 'started',
         }
-        write_tool_event(started_event)
+
+        # Fast tools finish before a 'started' event could be shown, so they
+        # emit only a terminal event (the Demo Viewer accepts unpaired ones)
+        if avg_duration_ms is None or avg_duration_ms >= FAST_TOOL_THRESHOLD_MS:
+            # Queue 'started' event (fire-and-forget)
+            started_event = {
+                **started_template,
+                **call_fields,
+                'timestamp': start_timestamp,
+                'input': input_str,  # Matches TypeScript ToolCallEvent
+            }
+            enqueue_tool_event(started_event)
+        else:
+            call_fields['input'] = input_str
+            call_fields['started_implicit'] = True
 
         try:
             # Execute the actual tool function
             result = func(*args, **kwargs)
 
             # Calculate duration
-            end_time = datetime.now(timezone.utc)
-            duration_ms = int((end_time - start_time).total_seconds() * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            end_timestamp = start_timestamp + duration_ms
+            record_duration(duration_ms)
 
-            # Write 'completed' event (fire-and-forget)
-            # Format matches TypeScript ToolCallEvent interface
+            # Queue 'completed' event (fire-and-forget)
             completed_event = {
-                'workflow_id': session_id,  # DynamoDB uses workflow_id as partition key
-                'timestamp': int(end_time.timestamp() * 1000),  # epoch milliseconds
-                'event_type': 'tool_call',  # Required for TypeScript type guard
-                'event_id': event_id,
-                'agent_name': agent_name,  # Matches TypeScript ToolCallEvent
-                'system': 'agent',  # Default system for agent tools
-                'operation': tool_name,  # Tool function name
-                'status': 'completed',
+                **completed_template,
+                **call_fields,
+                'timestamp': end_timestamp,  # epoch milliseconds
                 'duration_ms': duration_ms,
             }
-            write_tool_event(completed_event)
+            enqueue_tool_event(completed_event)
 
             return result
 
         except Exception as e:
             # Calculate duration even on error
-            end_time = datetime.now(timezone.utc)
-            duration_ms = int((end_time - start_time).total_seconds() * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            end_timestamp = start_timestamp + duration_ms
+            record_duration(duration_ms)
 
-            # Write 'failed' event (fire-and-forget)
-            # Format matches TypeScript ToolCallEvent interface
+            # Queue 'failed' event (fire-and-forget)
             error_event = {
-                'workflow_id': session_id,  # DynamoDB uses workflow_id as partition key
-                'timestamp': int(end_time.timestamp() * 1000),  # epoch milliseconds
-                'event_type': 'tool_call',  # Required for TypeScript type guard
-                'event_id': event_id,
-                'agent_name': agent_name,  # Matches TypeScript ToolCallEvent
-                'system': 'agent',  # Default system for agent tools
-                'operation': tool_name,  # Tool function name
-                'status': 'failed',  # TypeScript uses 'failed' not 'error'
+                **failed_template,
+                **call_fields,
+                'timestamp': end_timestamp,  # epoch milliseconds
                 'duration_ms': duration_ms,
                 'error_message': _truncate_error(str(e)),
             }
-            write_tool_event(error_event)
+            enqueue_tool_event(error_event)
 
             # Re-raise the exception (don't swallow errors)
             raise
@@ -226,6 +297,19 @@ def instrument_tool(func: Callable[P, R]) -> Callable[P, R]:
     return wrapper
 
 
+def _bind_event_writer() -> Callable[[dict], None]:
+    """
+    Import enqueue_tool_event once and keep it in a module global.
+
+    The import is deferred so that importing this module (e.g. from tool
+    definitions) does not load boto3; later calls skip the import machinery.
+    """
+    global _enqueue_tool_event
+    from agents.shared.dynamodb_client import enqueue_tool_event
+    _enqueue_tool_event = enqueue_tool_event
+    return enqueue_tool_event
+
+
 def set_instrumentation_context(session_id: str, agent_name: str) -> None:
     """
     Set the instrumentation context for the current request.
@@ -261,10 +345,17 @@ def set_instrumentation_context(session_id: str, agent_name: str) -> None:
         - Always pair with clear_instrumentation_context() in a finally block
         - Call before any tools are invoked
         - Use consistent session_id across all agents in a workflow
+        - Values are stripped; if either is empty or not a string, no context
+          is set and tools run without emitting events
     """
-    global _session_id, _agent_name
-    _session_id = session_id
-    _agent_name = agent_name
+    context = None
+    if isinstance(session_id, str) and isinstance(agent_name, str):
+        session_id = session_id.strip()
+        agent_name = agent_name.strip()
+        if session_id and agent_name:
+            context = (session_id, agent_name)
+
+    _context.set(context)
 
 
 def get_instrumentation_context() -> tuple[str | None, str | None]:
@@ -277,8 +368,8 @@ def get_instrumentation_context() -> tuple[str | None, str | None]:
 
     Returns:
         tuple[str | None, str | None]: A tuple containing (session_id, agent_name).
-                                      Returns (None, None) if no context has been set
-                                      or if clear_instrumentation_context() was called.
+                                      Returns (None, None) if no valid context has been
+                                      set or if clear_instrumentation_context() was called.
 
     Usage:
         Check if context is available:
@@ -291,7 +382,7 @@ def get_instrumentation_context() -> tuple[str | None, str | None]:
         This function is primarily for internal use by the instrumentation system.
         Agent developers typically don't need to call this directly.
     """
-    return _session_id, _agent_name
+    return _context.get() or (None, None)
 
 
 def clear_instrumentation_context() -> None:
@@ -321,48 +412,15 @@ def clear_instrumentation_context() -> None:
         - Prevents context leakage between different workflow executions
         - Safe to call multiple times or when no context is set
     """
-    global _session_id, _agent_name
-    _session_id = None
-    _agent_name = None
-
-
-def _should_emit_events() -> bool:
-    """
-    Check if events should be emitted based on current context.
-
-    This function implements the context-dependent event emission logic.
-    Events are only emitted when both session_id and agent_name are set
-    and are non-empty strings after stripping whitespace.
-
-    Returns:
-        True if events should be emitted, False otherwise
-    """
-    session_id, agent_name = get_instrumentation_context()
-
-    # Check session_id is valid
-    if not session_id or not isinstance(session_id, str):
-        return False
-    session_id_clean = session_id.strip()
-    if not session_id_clean:
-        return False
-
-    # Check agent_name is valid
-    if not agent_name or not isinstance(agent_name, str):
-        return False
-    agent_name_clean = agent_name.strip()
-    if not agent_name_clean:
-        return False
-
-    return True
+    _context.set(None)
 
 
 def _truncate_json(params: dict, max_length: int = 200) -> str:
     """Truncate parameters JSON to max length for storage."""
-    import json
     try:
-        params_str = json.dumps(params)
+        params_str = _json_dumps(params)
         if len(params_str) > max_length:
-            return params_str[:max_length - 3] + '...'
+            return f'{params_str[:max_length - 3]}...'
         return params_str
     except Exception:
         return '{}'
@@ -63,19 +63,37 @@ This ensures memory failures never block agent execution.
 
 import os
 import logging
+import time
+from functools import lru_cache
 from typing import Optional
 
+try:
+    from agentcore.memory import MemoryClient as _MemoryClient
+except ImportError:  # SDK is optional; init_memory reports it as unavailable
+    _MemoryClient = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Module-level globals for memory client state
 _memory_client = None
+
+# True only after a successful init_memory; the single check on the tool hot path
+_available = False
 _memory_id: Optional[str] = None
 _session_id: Optional[str] = None
 _namespace: Optional[str] = None
 
+# Bumped by every successful store_context so cached searches never miss new content
+_store_epoch = 0
+
 # Configuration
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+SEARCH_CACHE_TTL_SECONDS = 60  # Repeated searches are served from cache for up to this long
+
+# Tool responses when memory is not initialized
+SEARCH_DISABLED_MESSAGE = 'Memory not initialized. Use external tools to fetch data.'
+STORE_DISABLED_MESSAGE = 'Memory not initialized. Context not stored.'
 
 
 def init_memory(session_id: str) -> bool:
@@ -108,10 +126,11 @@ def init_memory(session_id: str) -> bool:
         - Memory initialization is optional - workflows work without it
         - Missing MEMORY_ID environment variable disables memory gracefully
     """
-    global _memory_client, _memory_id, _session_id, _namespace
+    global _memory_client, _memory_id, _session_id, _namespace, _available
 
     # Store session_id regardless of memory availability
     _session_id = session_id
+    _available = False
 
     # Read MEMORY_ID from environment
     _memory_id = os.environ.get('MEMORY_ID')
@@ -122,24 +141,25 @@ def init_memory(session_id: str) -> bool:
     # Set namespace for session isolation
     _namespace = f'/workflow/{session_id}/context'
 
-    try:
-        # Import AgentCore Memory SDK
-        from agentcore.memory import MemoryClient
+    # Results cached for a previous client or session must not be served
+    _cached_retrieve.cache_clear()
 
+    if _MemoryClient is None:
+        logger.warning('AgentCore Memory SDK not available')
+        _memory_client = None
+        return False
+
+    try:
         # Initialize the memory client
-        _memory_client = MemoryClient(
+        _memory_client = _MemoryClient(
             memory_id=_memory_id,
             region=AWS_REGION
         )
 
         logger.info(f'Cross-agent memory initialized with namespace: {_namespace}')
+        _available = True
         return True
 
-    except ImportError as e:
-        logger.warning(f'AgentCore Memory SDK not available: {e}')
-        _memory_client = None
-        return False
-
     except Exception as e:
         logger.warning(f'Failed to initialize memory client: {e}')
         _memory_client = None
@@ -148,7 +168,25 @@ def init_memory(session_id: str) -> bool:
 
 def _is_memory_available() -> bool:
     """Check if memory client is initialized and available."""
-    return _memory_client is not None and _memory_id is not None
+    return _available
+
+
+@lru_cache(maxsize=256)
+def _cached_retrieve(epoch: int, ttl_bucket: int, namespace: str, query: str) -> tuple:
+    """
+    Retrieve memories, memoized per store epoch and TTL bucket.
+
+    epoch changes on every store and ttl_bucket every SEARCH_CACHE_TTL_SECONDS,
+    so a cached result is dropped as soon as new context is stored and never
+    outlives the TTL (long-term extraction is asynchronous, so content stored
+    by another process can appear without a local store). Exceptions are not
+    cached.
+    """
+    return tuple(_memory_client.retrieve_memories(
+        query=query,
+        namespace=namespace,
+        max_results=5
+    ) or ())
 
 
 def search_memory(query: str) -> str:
@@ -179,17 +217,20 @@ def search_memory(query: str) -> str:
         - Returns user-friendly message when memory not initialized
         - Never raises exceptions - always returns a string
         - Results are formatted for direct use in agent responses
+        - Identical queries are served from cache until context is stored
+          or SEARCH_CACHE_TTL_SECONDS elapses
     """
-    if not _is_memory_available():
+    if not _available:
         logger.debug('search_memory called but memory not initialized')
-        return 'Memory not initialized. Use external tools to fetch data.'
+        return SEARCH_DISABLED_MESSAGE
 
     try:
-        # Use AgentCore Memory retrieve_memories method
-        results = _memory_client.retrieve_memories(
-            query=query,
-            namespace=_namespace,
-            max_results=5
+        # Use AgentCore Memory retrieve_memories method (memoized)
+        results = _cached_retrieve(
+            _store_epoch,
+            int(time.monotonic() // SEARCH_CACHE_TTL_SECONDS),
+            _namespace,
+            query,
         )
 
         if not results or len(results) == 0:
@@ -241,9 +282,11 @@ def store_context(key: str, value: str) -> str:
         - Returns user-friendly message when memory not initialized
         - Key should be descriptive for search retrieval
     """
-    if not _is_memory_available():
+    global _store_epoch
+
+    if not _available:
         logger.debug('store_context called but memory not initialized')
-        return 'Memory not initialized. Context not stored.'
+        return STORE_DISABLED_MESSAGE
 
     try:
         # Use AgentCore Memory create_event method
@@ -254,6 +297,9 @@ def store_context(key: str, value: str) -> str:
             metadata={'key': key, 'session_id': _session_id}
         )
 
+        # Invalidate cached searches so the new context can be found
+        _store_epoch += 1
+
         logger.debug(f'Stored context with key: {key}')
         return f'Stored: {key}'
 
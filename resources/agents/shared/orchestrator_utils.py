@@ -10,28 +10,51 @@ This module is PRE-BUNDLED by the Agentify extension and should NOT be modified.
 """
 
 import argparse
+import atexit
 import json
 import os
+import queue
 import re
 import sys
+import threading
 import uuid
 import time
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, Iterator, List
 
 import boto3
 from botocore.config import Config
 import yaml
 
+try:
+    from orjson import dumps as _orjson_dumps, loads as _json_loads
+except ImportError:  # orjson is optional; events fall back to stdlib json
+    _orjson_dumps = None
+    _json_loads = json.loads
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 # ============================================================================
 # CLI ARGUMENT PARSING
 # ============================================================================
 
+# OpenTelemetry trace ID: 32 lowercase hex characters
+TRACE_ID_PATTERN = re.compile(r'\A[0-9a-f]{32}\Z')
+
 
 def parse_arguments() -> argparse.Namespace:
     """Parse and validate command line arguments."""
+    return _build_parser().parse_args()
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the orchestrator CLI parser once; repeated parses reuse it."""
     parser = argparse.ArgumentParser(
         description='Agentify Workflow Orchestrator',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -77,7 +100,7 @@ Examples:
         help='JSON string containing conversation history for multi-turn sessions'
     )
 
-    return parser.parse_args()
+    return parser
 
 
 def validate_arguments(args: argparse.Namespace) -> None:
@@ -91,13 +114,14 @@ def validate_arguments(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     trace_id = args.trace_id.strip().lower()
-    if len(trace_id) != 32:
-        print("Error: --trace-id must be exactly 32 characters", file=sys.stderr)
-        sys.exit(1)
-
-    if not all(c in '0123456789abcdef' for c in trace_id):
-        print("Error: --trace-id must contain only hexadecimal characters (0-9, a-f)", file=sys.stderr)
+    if not TRACE_ID_PATTERN.match(trace_id):
+        # Only the error path needs to know which rule failed
+        if len(trace_id) != 32:
+            print("Error: --trace-id must be exactly 32 characters", file=sys.stderr)
+        else:
+            print("Error: --trace-id must contain only hexadecimal characters (0-9, a-f)", file=sys.stderr)
         sys.exit(1)
+    args.trace_id = trace_id
 
     # Validate turn_number is a positive integer >= 1
     if args.turn_number < 1:
@@ -127,28 +151,32 @@ def validate_arguments(args: argparse.Namespace) -> None:
 # EVENT EMISSION
 # ============================================================================
 
+# Events are written by a background thread in batches of up to EVENT_BATCH_MAX
+# lines, waiting at most EVENT_BATCH_LINGER_SECONDS to fill one.
+# AGENTIFY_SYNC_EVENTS=1 writes each event inline instead.
+SYNC_EVENTS = os.environ.get('AGENTIFY_SYNC_EVENTS') == '1'
+EVENT_BATCH_MAX = 64
+EVENT_BATCH_LINGER_SECONDS = 0.005
+
+_event_queue: Optional[queue.SimpleQueue] = None
+_event_writer: Optional[threading.Thread] = None
+_event_writer_lock = threading.Lock()
+_EVENT_WRITER_STOP = object()
+
+# Stdlib fallback encoder, built once; compact output like orjson
+_encode_event_json = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
 
 def get_timestamp() -> int:
     """Get epoch timestamp in milliseconds."""
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def validate_event_schema(event: Dict[str, Any]) -> bool:
     """Validate event schema for required fields."""
-    required_fields = ['event_type', 'timestamp']
-
-    for field in required_fields:
-        if field not in event:
-            return False
-
+    # A missing field reads as None and fails its type check
     timestamp = event.get('timestamp')
-    if not isinstance(timestamp, int) or timestamp <= 0:
-        return False
-
-    if not isinstance(event.get('event_type'), str):
-        return False
-
-    return True
+    return type(timestamp) is int and timestamp > 0 and type(event.get('event_type')) is str
 
 
 def emit_event(event: Dict[str, Any]) -> None:
@@ -157,13 +185,25 @@ def emit_event(event: Dict[str, Any]) -> None:
 
     Events are emitted as JSON Lines format. Failures are logged but don't
     block workflow execution.
+
+    Each event is validated and serialized (with orjson when installed) on the
+    caller's thread, then handed to a background writer that batches lines
+    into one stdout write and flush. Pending events are written at exit.
     """
     try:
         if not validate_event_schema(event):
             print("Event schema validation failed: missing required fields", file=sys.stderr)
             return
 
-        print(json.dumps(event), flush=True)
+        if _orjson_dumps is not None:
+            line = _orjson_dumps(event) + b'\n'
+        else:
+            line = (_encode_event_json(event) + '\n').encode('utf-8')
+
+        if SYNC_EVENTS:
+            _write_event_lines((line,))
+        else:
+            _get_event_queue().put(line)
 
     except (TypeError, ValueError) as e:
         print(f"JSON serialization failed for event: {e}", file=sys.stderr)
@@ -173,6 +213,81 @@ def emit_event(event: Dict[str, Any]) -> None:
         print(f"Unexpected error during event emission: {e}", file=sys.stderr)
 
 
+def _write_event_lines(lines) -> None:
+    """Write serialized event lines to stdout with one write and one flush."""
+    data = b''.join(lines)
+    stdout = sys.stdout
+    buffer = getattr(stdout, 'buffer', None)
+    if buffer is None:
+        # stdout replaced by a text-only stream (e.g. in tests)
+        stdout.write(data.decode('utf-8'))
+        stdout.flush()
+        return
+
+    # Flush pending text-layer output first so lines stay in order
+    stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _get_event_queue() -> queue.SimpleQueue:
+    """Get the event queue, starting the background writer on first use."""
+    global _event_queue, _event_writer
+    if _event_queue is not None:
+        return _event_queue
+
+    with _event_writer_lock:
+        if _event_queue is None:
+            event_queue = queue.SimpleQueue()
+            _event_writer = threading.Thread(
+                target=_event_writer_loop, args=(event_queue,), name='event-writer', daemon=True,
+            )
+            _event_writer.start()
+            atexit.register(_stop_event_writer)
+            _event_queue = event_queue
+    return _event_queue
+
+
+def _event_writer_loop(event_queue: queue.SimpleQueue) -> None:
+    """Write queued event lines in batches until the stop sentinel arrives."""
+    while True:
+        line = event_queue.get()
+        if line is _EVENT_WRITER_STOP:
+            return
+
+        batch = [line]
+        stop = False
+        deadline = time.monotonic() + EVENT_BATCH_LINGER_SECONDS
+        while len(batch) < EVENT_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            try:
+                line = event_queue.get(timeout=remaining) if remaining > 0 else event_queue.get_nowait()
+            except queue.Empty:
+                break
+            if line is _EVENT_WRITER_STOP:
+                stop = True
+                break
+            batch.append(line)
+
+        try:
+            _write_event_lines(batch)
+        except Exception as e:
+            print(f"Event emission I/O error: {e}", file=sys.stderr)
+
+        if stop:
+            return
+
+
+def _stop_event_writer() -> None:
+    """Write all pending events before the process exits (registered with atexit)."""
+    global SYNC_EVENTS
+    # Anything emitted during shutdown is written inline
+    SYNC_EVENTS = True
+    if _event_queue is not None and _event_writer is not None:
+        _event_queue.put(_EVENT_WRITER_STOP)
+        _event_writer.join(timeout=5)
+
+
 # ============================================================================
 # ENVIRONMENT AND CONFIGURATION
 # ============================================================================
@@ -214,7 +329,7 @@ def load_agent_config() -> Dict[str, Dict[str, Any]]:
         raise FileNotFoundError(f"Agent config not found: {config_path}")
 
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
 
     agents = {}
     for agent_key, agent_config in config.get('agents', {}).items():
@@ -240,6 +355,87 @@ def get_available_agents() -> list:
 # REMOTE AGENT INVOCATION
 # ============================================================================
 
+# Shared botocore settings for orchestrator clients: adaptive retries and a
+# pool large enough for concurrent agent invocations
+BOTO_CLIENT_CONFIG = Config(
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    max_pool_connections=32,
+)
+
+
+@lru_cache(maxsize=None)
+def get_boto_client(service: str, region_name: Optional[str] = None) -> Any:
+    """
+    Get a boto3 client shared across calls, one per (service, region).
+
+    Creating a client costs tens of milliseconds and a fresh connection pool,
+    so orchestrators reuse one per service instead of building it per call.
+
+    Args:
+        service: AWS service name (e.g., 'bedrock-agentcore')
+        region_name: AWS region (defaults to the boto3 session region)
+
+    Returns:
+        boto3 client for the service
+    """
+    return boto3.client(service, region_name=region_name, config=BOTO_CLIENT_CONFIG)
+
+
+def _json_dumps_bytes(value: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON bytes (orjson when installed)."""
+    if _orjson_dumps is not None:
+        return _orjson_dumps(value)
+    return json.dumps(value).encode('utf-8')
+
+
+def _join_text_blocks(content: Any) -> Optional[str]:
+    """Join the 'text' of each content block, or None if there are none."""
+    text_parts = [item['text'] for item in content if isinstance(item, dict) and 'text' in item]
+    return '\n'.join(text_parts) if text_parts else None
+
+
+def _extract_response(parsed: Any) -> Optional[Dict[str, Any]]:
+    """
+    Extract the response dict from a parsed agent payload.
+
+    Returns None when the payload has no recognized shape, so the caller can
+    fall back to the raw text.
+    """
+    if not isinstance(parsed, dict):
+        return None
+
+    get = parsed.get
+    inner_response = get('response')
+
+    # Handle: {'response': 'text string'} - the common flat shape
+    if isinstance(inner_response, str) and 'content' not in parsed:
+        return parsed
+
+    # Handle: {'response': {'role': 'assistant', 'content': [{'text': '...'}]}}
+    if isinstance(inner_response, dict) and 'content' in inner_response:
+        text = _join_text_blocks(inner_response['content'])
+        if text is not None:
+            return {'response': text}
+
+    # Handle: {'role': 'assistant', 'content': [{'text': '...'}]}
+    message_content = get('content')
+    if isinstance(message_content, list):
+        text = _join_text_blocks(message_content)
+        if text is not None:
+            return {'response': text}
+
+    if isinstance(inner_response, str):
+        return parsed
+    return None
+
+
+def _iter_sse_data(body: Any) -> Iterator[bytes]:
+    """Yield the payload of each 'data: ' line of a server-sent event stream."""
+    for line in body.iter_lines():
+        if line.startswith(b'data: '):
+            yield line[6:]
+
 
 def invoke_agent_remotely(agent_id: str, prompt: str, session_id: str) -> Dict[str, Any]:
     """
@@ -268,12 +464,12 @@ def invoke_agent_remotely(agent_id: str, prompt: str, session_id: str) -> Dict[s
     print(f"Invoking remote agent '{agent_id}' at {agent['arn']}", file=sys.stderr)
 
     try:
-        client = boto3.client('bedrock-agentcore', region_name=agent['region'])
+        client = get_boto_client('bedrock-agentcore', agent['region'])
 
-        payload = json.dumps({
+        payload = _json_dumps_bytes({
             'prompt': prompt,
             'session_id': session_id
-        }).encode()
+        })
 
         response = client.invoke_agent_runtime(
             agentRuntimeArn=agent['arn'],
@@ -281,54 +477,25 @@ def invoke_agent_remotely(agent_id: str, prompt: str, session_id: str) -> Dict[s
             payload=payload
         )
 
-        # Handle streaming response - collect all bytes first, then decode
+        # Handle streaming response - collect all bytes first, then decode once
+        # so multi-byte characters split across chunks stay intact
         content_type = response.get('contentType', '')
-        raw_bytes = b''
 
         if 'text/event-stream' in content_type:
-            for line in response['response'].iter_lines():
-                if line:
-                    # Preserve line separators for proper parsing
-                    raw_bytes += line + b'\n'
-            decoded = raw_bytes.decode('utf-8')
-            lines = decoded.split('\n')
-            content = [line[6:] for line in lines if line.startswith('data: ')]
-            response_text = '\n'.join(content)
+            raw_bytes = b'\n'.join(_iter_sse_data(response['response']))
         else:
-            for chunk in response.get('response', []):
-                raw_bytes += chunk
-            response_text = raw_bytes.decode('utf-8')
+            raw_bytes = b''.join(response.get('response', []))
 
-        # Parse nested Bedrock message format
+        # Parse nested Bedrock message format straight from the bytes
         try:
-            parsed = json.loads(response_text)
-            if isinstance(parsed, dict):
-                # Handle: {'response': {'role': 'assistant', 'content': [{'text': '...'}]}}
-                inner_response = parsed.get('response')
-                if isinstance(inner_response, dict) and 'content' in inner_response:
-                    text_parts = []
-                    for item in inner_response.get('content', []):
-                        if isinstance(item, dict) and 'text' in item:
-                            text_parts.append(item['text'])
-                    if text_parts:
-                        return {'response': '\n'.join(text_parts)}
-
-                # Handle: {'role': 'assistant', 'content': [{'text': '...'}]}
-                if 'content' in parsed and isinstance(parsed['content'], list):
-                    text_parts = []
-                    for item in parsed['content']:
-                        if isinstance(item, dict) and 'text' in item:
-                            text_parts.append(item['text'])
-                    if text_parts:
-                        return {'response': '\n'.join(text_parts)}
-
-                # Handle: {'response': 'text string'}
-                if 'response' in parsed and isinstance(parsed['response'], str):
-                    return parsed
-        except json.JSONDecodeError:
+            extracted = _extract_response(_json_loads(raw_bytes))
+            if extracted is not None:
+                return extracted
+        except ValueError:
+            # Not JSON (orjson and json decode errors both subclass ValueError)
             pass
 
-        return {'response': response_text}
+        return {'response': raw_bytes.decode('utf-8')}
 
     except Exception as e:
         error_msg = f"Agent '{agent_id}' invocation failed: {e}"
@@ -367,33 +534,32 @@ def print_workflow_summary(session_id: str, workflow_id: str, trace_id: str,
     end_time = time.time()
     total_duration = end_time - start_time
 
-    print("=" * 80, file=sys.stderr)
-    print("WORKFLOW EXECUTION COMPLETED SUCCESSFULLY", file=sys.stderr)
-    print("=" * 80, file=sys.stderr)
-    print("", file=sys.stderr)
-
-    print("EXECUTION SUMMARY:", file=sys.stderr)
-    print(f"  Workflow ID:     {workflow_id}", file=sys.stderr)
-    print(f"  Session ID:      {session_id}", file=sys.stderr)
-    print(f"  Trace ID:        {trace_id}", file=sys.stderr)
-    print(f"  Total Duration:  {total_duration:.2f} seconds", file=sys.stderr)
-    print(f"  Exit Code:       0 (SUCCESS)", file=sys.stderr)
-    print("", file=sys.stderr)
-
-    print("ROUTING SUMMARY:", file=sys.stderr)
-    route_display = ' -> '.join([get_agent_display_name(a) for a in agents_invoked])
-    print(f"  Path: {route_display}", file=sys.stderr)
-    print(f"  Agents Invoked:  {len(agents_invoked)}", file=sys.stderr)
-    print("", file=sys.stderr)
-
+    route_display = ' -> '.join(get_agent_display_name(a) for a in agents_invoked)
     response_text = final_response.get('response', 'No response')
     preview = response_text[:200] + '...' if len(response_text) > 200 else response_text
-    print("FINAL RESPONSE:", file=sys.stderr)
-    print(f"  {preview}", file=sys.stderr)
-    print("", file=sys.stderr)
 
-    print("Workflow execution completed successfully. Check stdout for JSON event stream.", file=sys.stderr)
-    print("=" * 80, file=sys.stderr)
+    # Build the whole summary first so it reaches stderr in a single write
+    sys.stderr.write(f"""{'=' * 80}
+WORKFLOW EXECUTION COMPLETED SUCCESSFULLY
+{'=' * 80}
+
+EXECUTION SUMMARY:
+  Workflow ID:     {workflow_id}
+  Session ID:      {session_id}
+  Trace ID:        {trace_id}
+  Total Duration:  {total_duration:.2f} seconds
+  Exit Code:       0 (SUCCESS)
+
+ROUTING SUMMARY:
+  Path: {route_display}
+  Agents Invoked:  {len(agents_invoked)}
+
+FINAL RESPONSE:
+  {preview}
+
+Workflow execution completed successfully. Check stdout for JSON event stream.
+{'=' * 80}
+""")
 
 
 def print_workflow_error_summary(session_id: str, workflow_id: str, trace_id: str,
@@ -403,26 +569,24 @@ def print_workflow_error_summary(session_id: str, workflow_id: str, trace_id: st
     end_time = time.time()
     total_duration = end_time - start_time
 
-    print("=" * 80, file=sys.stderr)
-    print("WORKFLOW EXECUTION FAILED", file=sys.stderr)
-    print("=" * 80, file=sys.stderr)
-    print("", file=sys.stderr)
+    sys.stderr.write(f"""{'=' * 80}
+WORKFLOW EXECUTION FAILED
+{'=' * 80}
 
-    print("EXECUTION SUMMARY:", file=sys.stderr)
-    print(f"  Workflow ID:     {workflow_id}", file=sys.stderr)
-    print(f"  Session ID:      {session_id}", file=sys.stderr)
-    print(f"  Trace ID:        {trace_id}", file=sys.stderr)
-    print(f"  Total Duration:  {total_duration:.2f} seconds", file=sys.stderr)
-    print(f"  Exit Code:       1 (FAILURE)", file=sys.stderr)
-    print("", file=sys.stderr)
+EXECUTION SUMMARY:
+  Workflow ID:     {workflow_id}
+  Session ID:      {session_id}
+  Trace ID:        {trace_id}
+  Total Duration:  {total_duration:.2f} seconds
+  Exit Code:       1 (FAILURE)
 
-    print("ERROR DETAILS:", file=sys.stderr)
-    print(f"  Agents Invoked:  {len(agents_invoked)}", file=sys.stderr)
-    print(f"  Error Message:   {error_message}", file=sys.stderr)
-    print("", file=sys.stderr)
+ERROR DETAILS:
+  Agents Invoked:  {len(agents_invoked)}
+  Error Message:   {error_message}
 
-    print("Workflow execution failed. Check stdout for JSON event stream and error events.", file=sys.stderr)
-    print("=" * 80, file=sys.stderr)
+Workflow execution failed. Check stdout for JSON event stream and error events.
+{'=' * 80}
+""")
 
 
 # ============================================================================
@@ -435,6 +599,33 @@ DEFAULT_HAIKU_MODEL_ID = "global.anthropic.claude-haiku-4-5-20251001-v1:0"
 # Default timeout for Haiku invocation (5 seconds)
 DEFAULT_HAIKU_TIMEOUT = 5
 
+# Region for Haiku invocation, read once at import
+HAIKU_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+
+# Request body fields shared by every Haiku invocation
+HAIKU_REQUEST_DEFAULTS = {
+    "anthropic_version": "bedrock-2023-05-31",
+    "max_tokens": 100,
+}
+
+# tech.md sections holding routing guidance, in order of preference
+ROUTING_SECTION_HEADERS = ('## Routing Guidance', '## Agent Routing Rules')
+
+# Start of the next level-2 markdown section
+NEXT_SECTION_PATTERN = re.compile(r'\n##\s')
+
+
+@lru_cache(maxsize=None)
+def _get_haiku_client(region: str, timeout: int) -> Any:
+    """Get a bedrock-runtime client shared across calls, one per (region, timeout)."""
+    # Configure boto3 client with timeout
+    config = Config(
+        read_timeout=timeout,
+        connect_timeout=timeout,
+        retries={'max_attempts': 1}
+    )
+    return boto3.client('bedrock-runtime', region_name=region, config=config)
+
 
 def invoke_haiku(prompt: str, model_id: str = DEFAULT_HAIKU_MODEL_ID,
                  timeout: int = DEFAULT_HAIKU_TIMEOUT) -> Optional[str]:
@@ -450,20 +641,11 @@ def invoke_haiku(prompt: str, model_id: str = DEFAULT_HAIKU_MODEL_ID,
         Model response text, or None on any failure (enables fallback)
     """
     try:
-        # Configure boto3 client with timeout
-        config = Config(
-            read_timeout=timeout,
-            connect_timeout=timeout,
-            retries={'max_attempts': 1}
-        )
-
-        region = os.environ.get('AWS_REGION', 'us-east-1')
-        client = boto3.client('bedrock-runtime', region_name=region, config=config)
+        client = _get_haiku_client(HAIKU_REGION, timeout)
 
         # Build request body for Claude Haiku
         request_body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 100,
+            **HAIKU_REQUEST_DEFAULTS,
             "messages": [
                 {
                     "role": "user",
@@ -476,11 +658,11 @@ def invoke_haiku(prompt: str, model_id: str = DEFAULT_HAIKU_MODEL_ID,
             modelId=model_id,
             contentType="application/json",
             accept="application/json",
-            body=json.dumps(request_body)
+            body=_json_dumps_bytes(request_body)
         )
 
         # Parse response
-        response_body = json.loads(response['body'].read())
+        response_body = _json_loads(response['body'].read())
         content = response_body.get('content', [])
 
         if content and isinstance(content, list) and len(content) > 0:
@@ -502,15 +684,21 @@ def get_routing_context(workspace_path: Optional[str] = None) -> str:
     Looks for a section named "## Routing Guidance" or "## Agent Routing Rules"
     and extracts the content between that header and the next ## header (or EOF).
 
+    The result is cached per workspace (tech.md is read once per process).
+
     Args:
         workspace_path: Path to the project workspace (defaults to current working directory)
 
     Returns:
         Routing guidance content as string, or empty string if not found
     """
-    if workspace_path is None:
-        workspace_path = os.getcwd()
+    # Normalize so '.', None and the absolute path share one cache entry
+    return _load_routing_context(os.path.abspath(workspace_path or os.getcwd()))
 
+
+@lru_cache(maxsize=8)
+def _load_routing_context(workspace_path: str) -> str:
+    """Read and extract the routing guidance section for a normalized workspace path."""
     # Try to find tech.md in .kiro/steering/
     tech_md_path = Path(workspace_path) / '.kiro' / 'steering' / 'tech.md'
 
@@ -521,30 +709,24 @@ def get_routing_context(workspace_path: Optional[str] = None) -> str:
         content = tech_md_path.read_text(encoding='utf-8')
 
         # Look for "## Routing Guidance" or "## Agent Routing Rules" section
-        section_headers = ['## Routing Guidance', '## Agent Routing Rules']
-
-        for header in section_headers:
-            if header in content:
-                # Find start of section
-                start_idx = content.find(header)
-                if start_idx == -1:
-                    continue
-
-                # Move past the header line
-                start_idx = content.find('\n', start_idx)
-                if start_idx == -1:
-                    continue
-                start_idx += 1
-
-                # Find the next ## header (or end of file)
-                next_header_match = re.search(r'\n##\s', content[start_idx:])
-                if next_header_match:
-                    end_idx = start_idx + next_header_match.start()
-                else:
-                    end_idx = len(content)
-
-                section_content = content[start_idx:end_idx].strip()
-                return section_content
+        for header in ROUTING_SECTION_HEADERS:
+            # Find start of section
+            start_idx = content.find(header)
+            if start_idx == -1:
+                continue
+
+            # Move past the header line
+            start_idx = content.find('\n', start_idx)
+            if start_idx == -1:
+                continue
+            start_idx += 1
+
+            # Find the next ## header (or end of file), searching in place
+            next_header_match = NEXT_SECTION_PATTERN.search(content, start_idx)
+            end_idx = next_header_match.start() if next_header_match else len(content)
+
+            section_content = content[start_idx:end_idx].strip()
+            return section_content
 
         return ''
 
@@ -553,7 +735,6 @@ def get_routing_context(workspace_path: Optional[str] = None) -> str:
         return ''
 
 
-@lru_cache(maxsize=1)
 def load_routing_config(workspace_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load routing configuration from the project's .agentify/config.json file.
@@ -563,21 +744,27 @@ def load_routing_config(workspace_path: Optional[str] = None) -> Dict[str, Any]:
     - routerModel: global.anthropic.claude-haiku-4-5-20251001-v1:0
     - fallbackToAgentDecision: True
 
+    The result is cached per workspace (config.json is read once per process).
+
     Args:
         workspace_path: Path to the project workspace (defaults to current working directory)
 
     Returns:
         Dict with routing configuration settings
     """
+    # Normalize so '.', None and the absolute path share one cache entry
+    return _load_routing_config(os.path.abspath(workspace_path or os.getcwd()))
+
+
+@lru_cache(maxsize=16)
+def _load_routing_config(workspace_path: str) -> Dict[str, Any]:
+    """Read the routing section of config.json for a normalized workspace path."""
     defaults = {
         'useHaikuRouter': False,
         'routerModel': DEFAULT_HAIKU_MODEL_ID,
         'fallbackToAgentDecision': True
     }
 
-    if workspace_path is None:
-        workspace_path = os.getcwd()
-
     config_path = Path(workspace_path) / '.agentify' / 'config.json'
 
     try:
@@ -636,6 +823,46 @@ def emit_router_decision(workflow_id: str, trace_id: str, router_model: str,
     emit_event(event)
 
 
+@lru_cache(maxsize=32)
+def _routing_prompt_parts(available_agents: tuple, workspace_path: str) -> tuple:
+    """
+    Build the parts of the routing prompt that only depend on the agents and workspace.
+
+    Returns:
+        Tuple of (available agents line, text following the suggestion line)
+    """
+    agents_list = ', '.join(available_agents)
+
+    # Load routing guidance from tech.md
+    routing_context = get_routing_context(workspace_path)
+
+    prompt_tail = f"""
+
+{f'Routing guidance: {routing_context}' if routing_context else ''}
+
+The agent's suggestion is a hint from a domain expert. Consider it, but make your own decision based on the response content and routing guidance. The agent may not know all available agents.
+
+Respond with ONLY one of the following:
+- An agent ID from the available agents list (exactly as shown)
+- The word "COMPLETE" if the workflow should end (task is finished)
+
+Your response (agent ID or COMPLETE):"""
+    return f"Available agents: {agents_list}", prompt_tail
+
+
+@lru_cache(maxsize=32)
+def _routing_targets(available_agents: tuple) -> Dict[str, str]:
+    """
+    Map lowercased routing results to their canonical form.
+
+    Agent IDs keep their original spelling (first match wins) and 'complete'
+    maps to 'COMPLETE', which takes precedence over an agent of that name.
+    """
+    targets = {agent.lower(): agent for agent in reversed(available_agents)}
+    targets['complete'] = 'COMPLETE'
+    return targets
+
+
 def route_with_haiku(current_agent: str, response_text: str,
                      available_agents: List[str],
                      workflow_id: str = "", trace_id: str = "",
@@ -672,29 +899,19 @@ def route_with_haiku(current_agent: str, response_text: str,
         # Truncate response to ~500 characters for minimal context
         truncated_response = response_text[:500] if len(response_text) > 500 else response_text
 
-        # Load routing guidance from tech.md
-        routing_context = get_routing_context(workspace_path)
-
-        # Build the routing prompt
-        agents_list = ', '.join(available_agents)
+        # Build the routing prompt around the cached agents list and guidance
+        agents = tuple(available_agents)
+        agents_line, prompt_tail = _routing_prompt_parts(
+            agents, os.path.abspath(workspace_path or os.getcwd())
+        )
         suggestion_text = f"Agent's routing suggestion: {agent_suggestion}" if agent_suggestion else "Agent's routing suggestion: None"
         prompt = f"""You are a routing agent. Based on the agent response below, determine which agent should handle the next step.
 
 Current agent: {current_agent}
 Agent response (truncated): {truncated_response}
 
-Available agents: {agents_list}
-{suggestion_text}
-
-{f'Routing guidance: {routing_context}' if routing_context else ''}
-
-The agent's suggestion is a hint from a domain expert. Consider it, but make your own decision based on the response content and routing guidance. The agent may not know all available agents.
-
-Respond with ONLY one of the following:
-- An agent ID from the available agents list (exactly as shown)
-- The word "COMPLETE" if the workflow should end (task is finished)
-
-Your response (agent ID or COMPLETE):"""
+{agents_line}
+{suggestion_text}{prompt_tail}"""
 
         # Invoke Haiku
         result = invoke_haiku(prompt, model_id=model_id)
@@ -702,32 +919,21 @@ Your response (agent ID or COMPLETE):"""
         if result is None:
             return None
 
-        # Parse the result
-        result = result.strip().upper()
-
-        # Check for COMPLETE
-        if result == 'COMPLETE':
-            duration_ms = int((time.time() - start_time) * 1000)
-            if workflow_id and trace_id:
-                emit_router_decision(workflow_id, trace_id, 'haiku',
-                                    current_agent, 'COMPLETE', duration_ms,
-                                    agent_suggestion=agent_suggestion)
-            return 'COMPLETE'
-
-        # Check if result matches an available agent (case-insensitive)
-        result_lower = result.lower()
-        for agent in available_agents:
-            if agent.lower() == result_lower:
-                duration_ms = int((time.time() - start_time) * 1000)
-                if workflow_id and trace_id:
-                    emit_router_decision(workflow_id, trace_id, 'haiku',
-                                        current_agent, agent, duration_ms,
-                                        agent_suggestion=agent_suggestion)
-                return agent
-
-        # Result didn't match any agent or COMPLETE
-        print(f"Haiku routing result '{result}' not recognized", file=sys.stderr)
-        return None
+        # Parse the result: one case-insensitive lookup yields COMPLETE or a canonical agent ID
+        raw_result = result.strip()
+        decision = _routing_targets(agents).get(raw_result.lower())
+
+        if decision is None:
+            # Result didn't match any agent or COMPLETE
+            print(f"Haiku routing result '{raw_result}' not recognized", file=sys.stderr)
+            return None
+
+        if workflow_id and trace_id:
+            emit_router_decision(workflow_id, trace_id, 'haiku',
+                                current_agent, decision,
+                                int((time.time() - start_time) * 1000),
+                                agent_suggestion=agent_suggestion)
+        return decision
 
     except Exception as e:
         print(f"Haiku routing failed: {e}", file=sys.stderr)
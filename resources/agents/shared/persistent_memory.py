@@ -90,16 +90,25 @@ This ensures memory failures never block agent execution.
 
 import os
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Optional
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Module-level globals for persistent memory client state
-_persistent_memory_client = None
-_persistent_memory_id: Optional[str] = None
-_effective_id: Optional[str] = None
-_namespace: Optional[str] = None
+
+@dataclass(frozen=True)
+class _PersistentMemoryState:
+    """Persistent memory client state, replaced as a whole on each init."""
+    client: Any = None
+    memory_id: Optional[str] = None
+    effective_id: Optional[str] = None
+    namespace: Optional[str] = None
+
+
+# Current persistent memory state; tools read it once per call so they see a
+# consistent snapshot even if init_persistent_memory runs concurrently
+_state = _PersistentMemoryState()
 
 # Configuration
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
@@ -143,52 +152,55 @@ def init_persistent_memory(user_id: Optional[str], session_id: str) -> bool:
         - Memory initialization is optional - workflows work without it
         - Missing PERSISTENT_MEMORY_ID environment variable disables memory gracefully
     """
-    global _persistent_memory_client, _persistent_memory_id, _effective_id, _namespace
+    global _state
 
     # Determine effective_id with priority: user_id > session_id > WORKFLOW_ID
-    _effective_id = user_id or session_id or os.environ.get('WORKFLOW_ID')
-    if not _effective_id:
+    effective_id = user_id or session_id or os.environ.get('WORKFLOW_ID')
+    if not effective_id:
         logger.warning('No user_id, session_id, or WORKFLOW_ID available - persistent memory disabled')
+        _state = _PersistentMemoryState()
         return False
 
     # Read PERSISTENT_MEMORY_ID from environment
-    _persistent_memory_id = os.environ.get('PERSISTENT_MEMORY_ID')
-    if not _persistent_memory_id:
+    memory_id = os.environ.get('PERSISTENT_MEMORY_ID')
+    if not memory_id:
         logger.info('PERSISTENT_MEMORY_ID not set - persistent memory disabled')
+        _state = _PersistentMemoryState(effective_id=effective_id)
         return False
 
     # Set namespace for user isolation
-    _namespace = f'/users/{_effective_id}/preferences'
+    namespace = f'/users/{effective_id}/preferences'
+    disabled = _PersistentMemoryState(
+        memory_id=memory_id, effective_id=effective_id, namespace=namespace
+    )
 
     try:
         # Import AgentCore Memory SDK
         from agentcore.memory import MemoryClient
 
         # Initialize the memory client
-        _persistent_memory_client = MemoryClient(
-            memory_id=_persistent_memory_id,
+        client = MemoryClient(
+            memory_id=memory_id,
             region=AWS_REGION
         )
 
-        logger.info(f'Persistent memory initialized with namespace: {_namespace}')
+        _state = _PersistentMemoryState(
+            client=client, memory_id=memory_id, effective_id=effective_id, namespace=namespace
+        )
+        logger.info(f'Persistent memory initialized with namespace: {namespace}')
         return True
 
     except ImportError as e:
         logger.warning(f'AgentCore Memory SDK not available: {e}')
-        _persistent_memory_client = None
+        _state = disabled
         return False
 
     except Exception as e:
         logger.warning(f'Failed to initialize persistent memory client: {e}')
-        _persistent_memory_client = None
+        _state = disabled
         return False
 
 
-def _is_persistent_memory_available() -> bool:
-    """Check if persistent memory client is initialized and available."""
-    return _persistent_memory_client is not None and _persistent_memory_id is not None
-
-
 def remember_preference(category: str, preference: str, value: str) -> str:
     """
     Store a user preference in persistent memory.
@@ -222,7 +234,8 @@ def remember_preference(category: str, preference: str, value: str) -> str:
         - Returns user-friendly message when memory not initialized
         - Category helps organize and retrieve related preferences
     """
-    if not _is_persistent_memory_available():
+    state = _state
+    if state.client is None:
         logger.debug('remember_preference called but persistent memory not initialized')
         return 'Persistent memory not initialized. Preference not stored.'
 
@@ -231,13 +244,13 @@ def remember_preference(category: str, preference: str, value: str) -> str:
         content = f'{category}/{preference}: {value}'
 
         # Use AgentCore Memory create_event method
-        _persistent_memory_client.create_event(
+        state.client.create_event(
             content=content,
-            namespace=_namespace,
+            namespace=state.namespace,
             metadata={
                 'category': category,
                 'preference': preference,
-                'effective_id': _effective_id,
+                'effective_id': state.effective_id,
                 'type': 'preference'
             }
         )
@@ -283,42 +296,44 @@ def recall_preferences(query: str, category: Optional[str] = None) -> str:
         - Never raises exceptions - always returns a string
         - Results are formatted for direct use in agent responses
     """
-    if not _is_persistent_memory_available():
+    state = _state
+    if state.client is None:
         logger.debug('recall_preferences called but persistent memory not initialized')
         return 'Persistent memory not initialized. Cannot recall preferences.'
 
     try:
         # Build namespace with optional category filter
-        search_namespace = _namespace
+        search_namespace = state.namespace
         if category:
-            search_namespace = f'{_namespace}/{category}'
+            search_namespace = f'{state.namespace}/{category}'
 
         # Use AgentCore Memory retrieve_memories method
-        results = _persistent_memory_client.retrieve_memories(
+        results = state.client.retrieve_memories(
             query=query,
             namespace=search_namespace,
             max_results=10
         )
 
-        if not results or len(results) == 0:
+        if not results:
             return 'No matching preferences found.'
 
         # Format results for agent consumption
-        formatted = []
-        for i, memory in enumerate(results, 1):
-            content = memory.get('content', '')
-            metadata = memory.get('metadata', {})
-            pref_category = metadata.get('category', 'unknown')
-            pref_name = metadata.get('preference', 'unknown')
-            formatted.append(f'{i}. [{pref_category}/{pref_name}]: {content}')
-
-        return '\n'.join(formatted)
+        return '\n'.join(_format_preference(i, memory) for i, memory in enumerate(results, 1))
 
     except Exception as e:
         logger.warning(f'Persistent memory search error: {e}')
         return 'Preference search unavailable. Cannot recall preferences.'
 
 
+def _format_preference(index: int, memory: dict) -> str:
+    """Format one recalled preference as a numbered line."""
+    metadata = memory.get('metadata', {})
+    return (
+        f"{index}. [{metadata.get('category', 'unknown')}/{metadata.get('preference', 'unknown')}]: "
+        f"{memory.get('content', '')}"
+    )
+
+
 def log_feedback(entity_type: str, entity_id: str, rating: int, notes: Optional[str] = None) -> str:
     """
     Log user feedback in persistent memory.
@@ -355,7 +370,8 @@ def log_feedback(entity_type: str, entity_id: str, rating: int, notes: Optional[
         - Returns user-friendly message when memory not initialized
         - Feedback is stored with timestamp for trend analysis
     """
-    if not _is_persistent_memory_available():
+    state = _state
+    if state.client is None:
         logger.debug('log_feedback called but persistent memory not initialized')
         return 'Persistent memory not initialized. Feedback not logged.'
 
@@ -366,14 +382,14 @@ def log_feedback(entity_type: str, entity_id: str, rating: int, notes: Optional[
             content += f' - {notes}'
 
         # Use AgentCore Memory create_event method
-        _persistent_memory_client.create_event(
+        state.client.create_event(
             content=content,
-            namespace=f'{_namespace}/feedback',
+            namespace=f'{state.namespace}/feedback',
             metadata={
                 'entity_type': entity_type,
                 'entity_id': entity_id,
                 'rating': rating,
-                'effective_id': _effective_id,
+                'effective_id': state.effective_id,
                 'type': 'feedback'
             }
         )
@@ -395,9 +411,10 @@ def get_persistent_memory_status() -> dict:
     Returns:
         dict: Memory status including initialization state and configuration
     """
+    state = _state
     return {
-        'initialized': _is_persistent_memory_available(),
-        'memory_id': _persistent_memory_id if _persistent_memory_id else 'not configured',
-        'effective_id': _effective_id if _effective_id else 'not set',
-        'namespace': _namespace if _namespace else 'not set'
+        'initialized': state.client is not None,
+        'memory_id': state.memory_id if state.memory_id else 'not configured',
+        'effective_id': state.effective_id if state.effective_id else 'not set',
+        'namespace': state.namespace if state.namespace else 'not set'
     }
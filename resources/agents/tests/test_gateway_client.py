@@ -0,0 +1,38 @@
+"""Tests for Gateway tool input serialization in agents.shared.gateway_client."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Templates import the shared modules as `agents.shared`, rooted at resources/
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+gateway_client = pytest.importorskip('agents.shared.gateway_client')
+
+
+def test_truncate_tool_input_caps_large_nested_value():
+    rows = [{'id': i, 'name': f'row-{i}'} for i in range(100_000)]
+    # Not JSON serializable: encoding the whole value would raise TypeError
+    rows.append(object())
+
+    result = gateway_client._truncate_tool_input({'query': 'select', 'rows': rows})
+
+    assert len(result) == gateway_client.TOOL_INPUT_MAX_CHARS
+    assert result.startswith('{"query": "select", "rows": [{"id": 0, "name": "row-0"}')
+    assert result.endswith('...')
+
+
+def test_truncate_tool_input_caps_large_top_level_list():
+    result = gateway_client._truncate_tool_input([list(range(50)) for _ in range(10_000)] + [object()])
+
+    assert len(result) == gateway_client.TOOL_INPUT_MAX_CHARS
+    assert result.startswith('[[0, 1, 2')
+    assert result.endswith('...')
+
+
+def test_truncate_tool_input_small_nested_value_is_exact():
+    data = {'filters': {'status': ['open', 'closed']}, 'limit': 10}
+
+    assert gateway_client._truncate_tool_input(data) == json.dumps(data)
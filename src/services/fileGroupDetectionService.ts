@@ -43,7 +43,7 @@ export const FILE_GROUPS: Omit<FileGroup, 'exists'>[] = [
     name: 'Agent Utilities',
     description: 'Observability, DynamoDB client, and OAuth utilities for agents',
     files: ['agents/shared/'],
-    consequence: 'Resets to bundled versions (instrumentation, dynamodb_client, gateway_auth). Custom code in this folder will be lost.',
+    consequence: 'Resets to bundled versions (instrumentation, dynamodb_client, gateway_client). Custom code in this folder will be lost.',
     defaultChecked: true,
   },
   {
@@ -207,14 +207,15 @@ describe('Task Group 6: Haiku Router Integration Tests', () => {
 
       const routeFunction = routeWithHaikuMatch![0];
 
-      // Verify COMPLETE check
-      expect(routeFunction).toMatch(/result\s*==\s*['"]COMPLETE['"]/);
+      // Verify COMPLETE is a routing target alongside the agent IDs
+      expect(utilsCode).toMatch(/targets\[['"]complete['"]\]\s*=\s*['"]COMPLETE['"]/);
+      expect(routeFunction).toContain('_routing_targets(');
 
-      // Verify emit_router_decision is called with 'COMPLETE' as next_agent
-      expect(routeFunction).toMatch(/emit_router_decision[\s\S]*?['"]COMPLETE['"]/);
+      // Verify the decision (agent ID or 'COMPLETE') is emitted as next_agent
+      expect(routeFunction).toMatch(/emit_router_decision\([\s\S]*?current_agent,\s*decision,/);
 
-      // Verify 'COMPLETE' is returned
-      expect(routeFunction).toContain("return 'COMPLETE'");
+      // Verify the same decision is returned
+      expect(routeFunction).toContain('return decision');
     });
   });
 